@@ -304,7 +304,16 @@ func (m *mockEventPublisher) PublishDriverEvent(ctx context.Context, eventType s
 	m.logger.Info("Publishing driver event",
 		zap.String("event_type", eventType),
 		zap.String("driver_id", driverID.String()),
-		zap.Any("data", data),
 	)
+
+	// Payload сериализуется через reflection, поэтому пишется только на уровне debug:
+	// Check не кодирует поля, если уровень отключен
+	if ce := m.logger.Check(zap.DebugLevel, "Driver event payload"); ce != nil {
+		ce.Write(
+			zap.String("event_type", eventType),
+			zap.String("driver_id", driverID.String()),
+			zap.Any("data", data),
+		)
+	}
 	return nil
 }
\ No newline at end of file
@@ -26,6 +26,7 @@ type ServerConfig struct {
 	MetricsPort int           `mapstructure:"metrics_port"`
 	Timeout     time.Duration `mapstructure:"timeout"`
 	Environment string        `mapstructure:"environment"`
+	EnableH2C   bool          `mapstructure:"enable_h2c"`
 }
 
 // DatabaseConfig конфигурация PostgreSQL
@@ -156,6 +157,7 @@ func setDefaults() {
 	viper.SetDefault("server.metrics_port", 9002)
 	viper.SetDefault("server.timeout", "30s")
 	viper.SetDefault("server.environment", "development")
+	viper.SetDefault("server.enable_h2c", false)
 
 	// Database
 	viper.SetDefault("database.host", "localhost")
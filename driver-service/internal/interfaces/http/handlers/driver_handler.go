@@ -88,6 +88,18 @@ type ListDriversResponse struct {
 	HasMore    bool              `json:"has_more"`
 }
 
+// ActiveDriversResponse ответ со списком активных водителей
+type ActiveDriversResponse struct {
+	Drivers []*DriverResponse `json:"drivers"`
+	Count   int               `json:"count"`
+}
+
+// ChangeStatusResponse ответ на изменение статуса водителя
+type ChangeStatusResponse struct {
+	Message string          `json:"message"`
+	Status  entities.Status `json:"status"`
+}
+
 // ErrorResponse стандартный ответ с ошибкой
 type ErrorResponse struct {
 	Error   string `json:"error"`
@@ -353,9 +365,9 @@ func (h *DriverHandler) ChangeStatus(c *gin.Context) {
 		return
 	}
 
-	c.JSON(http.StatusOK, gin.H{
-		"message": "Driver status changed successfully",
-		"status":  status,
+	c.JSON(http.StatusOK, &ChangeStatusResponse{
+		Message: "Driver status changed successfully",
+		Status:  status,
 	})
 }
 
@@ -373,9 +385,9 @@ func (h *DriverHandler) GetActiveDrivers(c *gin.Context) {
 		driverResponses[i] = h.toDriverResponse(driver)
 	}
 
-	c.JSON(http.StatusOK, gin.H{
-		"drivers": driverResponses,
-		"count":   len(driverResponses),
+	c.JSON(http.StatusOK, &ActiveDriversResponse{
+		Drivers: driverResponses,
+		Count:   len(driverResponses),
 	})
 }
 
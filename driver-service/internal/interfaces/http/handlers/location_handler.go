@@ -65,6 +65,12 @@ type LocationHistoryResponse struct {
 	Count     int                    `json:"count"`
 }
 
+// BatchUpdateLocationsResponse ответ на пакетное обновление местоположений
+type BatchUpdateLocationsResponse struct {
+	Message string `json:"message"`
+	Count   int    `json:"count"`
+}
+
 // NearbyDriversResponse ответ с водителями поблизости
 type NearbyDriversResponse struct {
 	Drivers []*NearbyDriverInfo `json:"drivers"`
@@ -173,9 +179,9 @@ func (h *LocationHandler) BatchUpdateLocations(c *gin.Context) {
 		return
 	}
 
-	c.JSON(http.StatusOK, gin.H{
-		"message": "Locations updated successfully",
-		"count":   len(locations),
+	c.JSON(http.StatusOK, &BatchUpdateLocationsResponse{
+		Message: "Locations updated successfully",
+		Count:   len(locations),
 	})
 }
 
@@ -211,9 +217,11 @@ func (h *LocationHandler) GetLocationHistory(c *gin.Context) {
 		return
 	}
 
-	// Парсим параметры времени
+	// Парсим параметры времени. Значения по умолчанию отсчитываются от одного
+	// момента, чтобы не читать часы дважды
 	var from, to time.Time
-	
+	now := time.Now()
+
 	if fromStr := c.Query("from"); fromStr != "" {
 		if fromUnix, err := strconv.ParseInt(fromStr, 10, 64); err == nil {
 			from = time.Unix(fromUnix, 0)
@@ -227,7 +235,7 @@ func (h *LocationHandler) GetLocationHistory(c *gin.Context) {
 			return
 		}
 	} else {
-		from = time.Now().Add(-24 * time.Hour) // По умолчанию последние 24 часа
+		from = now.Add(-24 * time.Hour) // По умолчанию последние 24 часа
 	}
 
 	if toStr := c.Query("to"); toStr != "" {
@@ -243,7 +251,15 @@ func (h *LocationHandler) GetLocationHistory(c *gin.Context) {
 			return
 		}
 	} else {
-		to = time.Now()
+		to = now
+	}
+
+	// Парсим лимит; без него возвращается вся история за интервал
+	limit := 0
+	if limitStr := c.Query("limit"); limitStr != "" {
+		if parsed, err := strconv.Atoi(limitStr); err == nil && parsed > 0 {
+			limit = parsed
+		}
 	}
 
 	// Получаем историю местоположений
@@ -253,14 +269,13 @@ func (h *LocationHandler) GetLocationHistory(c *gin.Context) {
 		return
 	}
 
-	// Получаем статистику
-	stats, err := h.locationService.GetLocationStats(c.Request.Context(), driverID, from, to)
-	if err != nil {
-		h.logger.Error("Failed to get location stats",
-			zap.Error(err),
-			zap.String("driver_id", driverID.String()),
-		)
-		// Не прерываем выполнение, просто не возвращаем статистику
+	// Статистика считается по уже полученной истории, без повторного запроса к БД
+	stats := entities.CalculateLocationStats(locations)
+
+	// Ограничиваем размер ответа последними limit точками (история отсортирована
+	// по времени записи); статистика считается по всему интервалу
+	if limit > 0 && len(locations) > limit {
+		locations = locations[len(locations)-limit:]
 	}
 
 	// Преобразуем в ответ
@@ -11,22 +11,31 @@ import (
 
 // Logger middleware для логирования HTTP запросов
 func Logger(logger *zap.Logger) gin.HandlerFunc {
-	return gin.LoggerWithConfig(gin.LoggerConfig{
-		Formatter: func(param gin.LogFormatterParams) string {
-			logger.Info("HTTP Request",
-				zap.String("client_ip", param.ClientIP),
-				zap.String("method", param.Method),
-				zap.String("path", param.Path),
-				zap.Int("status_code", param.StatusCode),
-				zap.Duration("latency", param.Latency),
-				zap.String("user_agent", param.Request.UserAgent()),
-				zap.Int("body_size", param.BodySize),
-				zap.String("request_id", param.Request.Header.Get("X-Request-ID")),
+	return func(c *gin.Context) {
+		start := time.Now()
+		path := c.Request.URL.Path
+		if raw := c.Request.URL.RawQuery; raw != "" {
+			path = path + "?" + raw
+		}
+
+		c.Next()
+
+		// Поля собираем только если уровень Info включен
+		if ce := logger.Check(zap.InfoLevel, "HTTP Request"); ce != nil {
+			ce.Write(
+				zap.String("client_ip", c.ClientIP()),
+				zap.String("method", c.Request.Method),
+				zap.String("path", path),
+				// Шаблон маршрута (например, /api/v1/drivers/:id) для агрегации запросов без учета ID
+				zap.String("route", c.FullPath()),
+				zap.Int("status_code", c.Writer.Status()),
+				zap.Duration("latency", time.Since(start)),
+				zap.String("user_agent", c.Request.UserAgent()),
+				zap.Int("body_size", c.Writer.Size()),
+				zap.String("request_id", c.Request.Header.Get("X-Request-ID")),
 			)
-			return ""
-		},
-		Output: nil,
-	})
+		}
+	}
 }
 
 // RequestID middleware для добавления уникального ID к каждому запросу
@@ -35,6 +35,9 @@ func NewServer(
 	}
 
 	router := gin.New()
+
+	// HTTP/2 без TLS (h2c): клиенты мультиплексируют запросы в одном соединении
+	router.UseH2C = cfg.Server.EnableH2C
 	
 	// Middleware
 	router.Use(gin.Recovery())
@@ -84,7 +87,7 @@ func NewServer(
 		router: router,
 		httpServer: &http.Server{
 			Addr:           fmt.Sprintf(":%d", cfg.Server.HTTPPort),
-			Handler:        router,
+			Handler:        router.Handler(),
 			ReadTimeout:    cfg.Server.Timeout,
 			WriteTimeout:   cfg.Server.Timeout,
 			IdleTimeout:    2 * cfg.Server.Timeout,
@@ -54,34 +54,35 @@ trap cleanup EXIT
 log "Starting test database services..."
 docker-compose -f docker-compose.test.yml up -d
 
-# Ждем готовности PostgreSQL
-log "Waiting for PostgreSQL to be ready..."
+# Функция ожидания готовности сервиса: wait_for <имя> <команда проверки...>
+# Пауза между проверками растет экспоненциально от 50ms до 500ms: сервис,
+# который поднимается за доли секунды, не ждет целую секунду до следующей проверки
+wait_for() {
+    local name=$1
+    shift
+    local deadline=$((SECONDS + timeout))
+    local delay=0.05
+    while ! docker-compose -f docker-compose.test.yml exec -T "$@" > /dev/null 2>&1; do
+        if [ $SECONDS -ge $deadline ]; then
+            error "$name failed to start within $timeout seconds"
+            return 1
+        fi
+        sleep $delay
+        delay=$(awk -v d="$delay" 'BEGIN { d *= 2; print (d > 0.5 ? 0.5 : d) }')
+    done
+    log "$name is ready"
+}
+
+# Ждем готовности PostgreSQL и Redis параллельно
+log "Waiting for PostgreSQL and Redis to be ready..."
 timeout=60
-counter=0
-while ! docker-compose -f docker-compose.test.yml exec -T test-postgres pg_isready -U test_user -d driver_service_test > /dev/null 2>&1; do
-    if [ $counter -ge $timeout ]; then
-        error "PostgreSQL failed to start within $timeout seconds"
-        exit 1
-    fi
-    sleep 1
-    counter=$((counter + 1))
-done
-
-log "PostgreSQL is ready"
-
-# Ждем готовности Redis
-log "Waiting for Redis to be ready..."
-counter=0
-while ! docker-compose -f docker-compose.test.yml exec -T test-redis redis-cli ping > /dev/null 2>&1; do
-    if [ $counter -ge $timeout ]; then
-        error "Redis failed to start within $timeout seconds"
-        exit 1
-    fi
-    sleep 1
-    counter=$((counter + 1))
-done
+wait_for "PostgreSQL" test-postgres pg_isready -U test_user -d driver_service_test &
+postgres_pid=$!
+wait_for "Redis" test-redis redis-cli ping &
+redis_pid=$!
 
-log "Redis is ready"
+wait $postgres_pid || exit 1
+wait $redis_pid || exit 1
 
 # Устанавливаем переменные окружения для тестов
 export TEST_DB_HOST=localhost
@@ -111,12 +112,12 @@ go test -v -race -coverprofile=coverage.out ./internal/...
 
 # Запускаем интеграционные тесты
 log "Running integration tests..."
-go test -v -race -tags=integration -timeout=10m ./tests/integration/...
+go test -v -race -tags=integration,go_json -parallel=4 -timeout=10m ./tests/integration/...
 
 # Запускаем performance тесты (если не в быстром режиме)
 if [ "${SKIP_PERFORMANCE_TESTS}" != "true" ]; then
     log "Running performance tests..."
-    go test -v -tags=integration -timeout=15m -run="Performance" ./tests/integration/...
+    go test -v -tags=integration,go_json -timeout=15m -run="Performance" ./tests/integration/...
 else
     warn "Skipping performance tests (SKIP_PERFORMANCE_TESTS=true)"
 fi
@@ -144,12 +144,19 @@ func CreateTestRating(driverID uuid.UUID, rating int) *entities.DriverRating {
 	}
 }
 
-// CreateMultipleTestDrivers создает несколько тестовых водителей
+// CreateMultipleTestDrivers создает несколько тестовых водителей.
+// Общие поля копируются из одного шаблона, а водители размещаются в одном
+// массиве; для каждого генерируются только ID и уникальные контакты
 func CreateMultipleTestDrivers(count int) []*entities.Driver {
+	template := CreateTestDriver()
+	backing := make([]entities.Driver, count)
 	drivers := make([]*entities.Driver, count)
 
-	for i := 0; i < count; i++ {
-		driver := CreateTestDriver()
+	for i := range backing {
+		driver := &backing[i]
+		*driver = *template
+		driver.ID = uuid.New()
+		driver.Metadata = make(entities.Metadata)
 		driver.Phone = fmt.Sprintf("+7900123456%d", i)
 		driver.Email = fmt.Sprintf("driver%d@example.com", i)
 		driver.LicenseNumber = fmt.Sprintf("TEST%06d", i)
@@ -159,21 +166,34 @@ func CreateMultipleTestDrivers(count int) []*entities.Driver {
 	return drivers
 }
 
-// CreateTestLocationHistory создает историю местоположений
+// CreateTestLocationHistory создает историю местоположений, заканчивающуюся текущим моментом
 func CreateTestLocationHistory(driverID uuid.UUID, count int, interval time.Duration) []*entities.DriverLocation {
-	locations := make([]*entities.DriverLocation, count)
 	baseTime := time.Now().Add(-time.Duration(count) * interval)
+	return CreateTestLocationHistoryFrom(driverID, baseTime, count, interval)
+}
 
-	// Начальные координаты (Москва)
-	baseLat := 55.7558
-	baseLon := 37.6173
+// CreateTestLocationHistoryFrom создает историю местоположений, начиная с baseTime.
+// Неизменные поля копируются из одного шаблона (указатели на необязательные поля
+// общие для всех записей), а сами записи размещаются в одном массиве, поэтому
+// в цикле меняются только время, координаты и скорость
+func CreateTestLocationHistoryFrom(driverID uuid.UUID, baseTime time.Time, count int, interval time.Duration) []*entities.DriverLocation {
+	template := CreateTestLocation(driverID)
+	backing := make([]entities.DriverLocation, count)
+	locations := make([]*entities.DriverLocation, count)
 
-	for i := 0; i < count; i++ {
-		location := CreateTestLocation(driverID)
+	// Начальные координаты (Москва)
+	baseLat := template.Latitude
+	baseLon := template.Longitude
+
+	for i := range backing {
+		location := &backing[i]
+		*location = *template
+		location.ID = uuid.New()
+		location.Metadata = make(entities.Metadata)
 		location.RecordedAt = baseTime.Add(time.Duration(i) * interval)
 		location.CreatedAt = location.RecordedAt
 
-		// Небольшие случайные отклонения координат для имитации движения
+		// Небольшие отклонения координат для имитации движения
 		location.Latitude = baseLat + float64(i)*0.001
 		location.Longitude = baseLon + float64(i)*0.001
 		location.Speed = floatPtr(float64(30 + i*2)) // Увеличиваем скорость
@@ -6,15 +6,25 @@ import (
 	"bytes"
 	"encoding/json"
 	"io"
+	"maps"
 	"net/http"
 	"net/http/httptest"
+	"sync"
 	"testing"
 	"time"
 
+	httpHandlers "driver-service/internal/interfaces/http/handlers"
+
 	"github.com/gin-gonic/gin"
+	gojson "github.com/goccy/go-json"
+	"github.com/google/uuid"
 	"github.com/stretchr/testify/require"
 )
 
+// Тела запросов и ответов кодируются через goccy/go-json - тот же кодек, что
+// использует gin с тегом go_json. encoding/json остается только ради типа
+// json.RawMessage, которым тесты передают готовые тела
+
 // APITestHelper помощник для тестирования HTTP API
 type APITestHelper struct {
 	router *gin.Engine
@@ -33,7 +43,7 @@ func NewAPITestHelper(router *gin.Engine, t *testing.T) *APITestHelper {
 type APIRequest struct {
 	Method      string
 	URL         string
-	Body        interface{}
+	Body        interface{} // значение для json.Marshal или готовый JSON ([]byte, json.RawMessage)
 	Headers     map[string]string
 	QueryParams map[string]string
 }
@@ -47,13 +57,57 @@ type APIResponse struct {
 
 // MakeRequest выполняет HTTP запрос и возвращает ответ
 func (h *APITestHelper) MakeRequest(req APIRequest) *APIResponse {
-	var bodyReader io.Reader
+	body, err := encodeBody(req.Body)
+	require.NoError(h.t, err)
+	return h.serve(req, body)
+}
 
-	// Подготавливаем тело запроса
-	if req.Body != nil {
-		bodyBytes, err := json.Marshal(req.Body)
+// MakeRequests выполняет независимые HTTP запросы параллельно и возвращает
+// ответы в порядке запросов. Тела сериализуются заранее в вызывающей горутине:
+// require нельзя вызывать из порожденных горутин
+func (h *APITestHelper) MakeRequests(reqs ...APIRequest) []*APIResponse {
+	bodies := make([][]byte, len(reqs))
+	for i := range reqs {
+		body, err := encodeBody(reqs[i].Body)
 		require.NoError(h.t, err)
-		bodyReader = bytes.NewBuffer(bodyBytes)
+		bodies[i] = body
+	}
+
+	responses := make([]*APIResponse, len(reqs))
+
+	var wg sync.WaitGroup
+	for i := range reqs {
+		wg.Add(1)
+		go func(i int) {
+			defer wg.Done()
+			responses[i] = h.serve(reqs[i], bodies[i])
+		}(i)
+	}
+	wg.Wait()
+
+	return responses
+}
+
+// encodeBody подготавливает тело запроса. Уже сериализованное тело ([]byte или
+// json.RawMessage) передается как есть, без повторного json.Marshal
+func encodeBody(body interface{}) ([]byte, error) {
+	switch body := body.(type) {
+	case nil:
+		return nil, nil
+	case []byte:
+		return body, nil
+	case json.RawMessage:
+		return body, nil
+	default:
+		return gojson.Marshal(body)
+	}
+}
+
+// serve выполняет запрос с уже сериализованным телом через роутер
+func (h *APITestHelper) serve(req APIRequest, body []byte) *APIResponse {
+	var bodyReader io.Reader
+	if body != nil {
+		bodyReader = bytes.NewReader(body)
 	}
 
 	// Создаем HTTP запрос
@@ -93,7 +147,7 @@ func (h *APITestHelper) MakeRequest(req APIRequest) *APIResponse {
 
 // UnmarshalResponse парсит JSON ответ в структуру
 func (h *APITestHelper) UnmarshalResponse(response *APIResponse, target interface{}) {
-	err := json.Unmarshal(response.Body, target)
+	err := gojson.Unmarshal(response.Body, target)
 	require.NoError(h.t, err, "Failed to unmarshal response: %s", string(response.Body))
 }
 
@@ -105,60 +159,106 @@ func (h *APITestHelper) AssertStatusCode(response *APIResponse, expectedCode int
 	}
 }
 
+// URL эндпоинтов API, не зависящих от конкретного водителя
+const (
+	DriversURL       = "/api/v1/drivers"
+	ActiveDriversURL = DriversURL + "/active"
+	NearbyDriversURL = "/api/v1/locations/nearby"
+	HealthURL        = "/health"
+)
+
+// DriverURLs URL эндпоинтов конкретного водителя, сформированные один раз
+type DriverURLs struct {
+	Driver          string
+	Status          string
+	Locations       string
+	BatchLocations  string
+	CurrentLocation string
+	LocationHistory string
+}
+
+// NewDriverURLs формирует URL эндпоинтов водителя
+func NewDriverURLs(driverID uuid.UUID) DriverURLs {
+	base := DriversURL + "/" + driverID.String()
+	return DriverURLs{
+		Driver:          base,
+		Status:          base + "/status",
+		Locations:       base + "/locations",
+		BatchLocations:  base + "/locations/batch",
+		CurrentLocation: base + "/locations/current",
+		LocationHistory: base + "/locations/history",
+	}
+}
+
+// driverRequestTemplate тело запроса на создание водителя. Строится один раз;
+// CreateDriverRequest возвращает его копию, которую можно изменять
+var driverRequestTemplate = map[string]interface{}{
+	"phone":           "+79001234567",
+	"email":           "test@example.com",
+	"first_name":      "Тест",
+	"last_name":       "Водитель",
+	"birth_date":      "1985-05-15T00:00:00Z",
+	"passport_series": "1234",
+	"passport_number": "567890",
+	"license_number":  "TEST123456",
+	"license_expiry":  "2026-12-31T00:00:00Z",
+}
+
+// locationRequestTemplate тело запроса на обновление местоположения
+var locationRequestTemplate = map[string]interface{}{
+	"latitude":  55.7558,
+	"longitude": 37.6173,
+	"altitude":  150.0,
+	"accuracy":  10.0,
+	"speed":     60.5,
+	"bearing":   45.0,
+}
+
 // CreateDriverRequest создает запрос на создание водителя
 func CreateDriverRequest() map[string]interface{} {
-	return map[string]interface{}{
-		"phone":           "+79001234567",
-		"email":           "test@example.com",
-		"first_name":      "Тест",
-		"last_name":       "Водитель",
-		"birth_date":      "1985-05-15T00:00:00Z",
-		"passport_series": "1234",
-		"passport_number": "567890",
-		"license_number":  "TEST123456",
-		"license_expiry":  "2026-12-31T00:00:00Z",
-	}
+	return maps.Clone(driverRequestTemplate)
 }
 
 // CreateLocationRequest создает запрос на обновление местоположения
 func CreateLocationRequest() map[string]interface{} {
-	return map[string]interface{}{
-		"latitude":  55.7558,
-		"longitude": 37.6173,
-		"altitude":  150.0,
-		"accuracy":  10.0,
-		"speed":     60.5,
-		"bearing":   45.0,
-	}
+	return maps.Clone(locationRequestTemplate)
 }
 
-// CreateBatchLocationRequest создает запрос на пакетное обновление местоположений
-func CreateBatchLocationRequest(count int) map[string]interface{} {
-	locations := make([]map[string]interface{}, count)
-
-	for i := 0; i < count; i++ {
-		locations[i] = map[string]interface{}{
-			"latitude":  55.7558 + float64(i)*0.001,
-			"longitude": 37.6173 + float64(i)*0.001,
-			"speed":     float64(50 + i*5),
+// CreateBatchLocationRequest создает запрос на пакетное обновление местоположений.
+// Точки заполняются в одном срезе типизированных структур, без map на каждую
+// точку; скорости лежат в общем массиве, на который ссылаются поля Speed
+func CreateBatchLocationRequest(count int) *httpHandlers.BatchLocationRequest {
+	locations := make([]httpHandlers.UpdateLocationRequest, count)
+	speeds := make([]float64, count)
+
+	for i := range locations {
+		speeds[i] = float64(50 + i*5)
+		locations[i] = httpHandlers.UpdateLocationRequest{
+			Latitude:  55.7558 + float64(i)*0.001,
+			Longitude: 37.6173 + float64(i)*0.001,
+			Speed:     &speeds[i],
 		}
 	}
 
-	return map[string]interface{}{
-		"locations": locations,
-	}
+	return &httpHandlers.BatchLocationRequest{Locations: locations}
+}
+
+// errorResponseBody тело ответа с ошибкой
+type errorResponseBody struct {
+	Error   string `json:"error"`
+	Code    string `json:"code"`
+	Details string `json:"details"`
 }
 
 // AssertErrorResponse проверяет структуру ошибки
 func (h *APITestHelper) AssertErrorResponse(response *APIResponse, expectedCode string) {
-	var errorResp struct {
-		Error   string `json:"error"`
-		Code    string `json:"code"`
-		Details string `json:"details"`
-	}
-
+	var errorResp errorResponseBody
 	h.UnmarshalResponse(response, &errorResp)
+	h.assertErrorCode(errorResp, expectedCode)
+}
 
+// assertErrorCode проверяет код уже разобранной ошибки
+func (h *APITestHelper) assertErrorCode(errorResp errorResponseBody, expectedCode string) {
 	if expectedCode != "" {
 		if errorResp.Code != expectedCode {
 			h.t.Errorf("Expected error code %s, got %s", expectedCode, errorResp.Code)
@@ -166,37 +266,43 @@ func (h *APITestHelper) AssertErrorResponse(response *APIResponse, expectedCode
 	}
 }
 
-// AssertValidationError проверяет ошибку валидации
+// AssertValidationError проверяет ошибку валидации.
+// Тело ответа разбирается один раз и используется для всех проверок
 func (h *APITestHelper) AssertValidationError(response *APIResponse, field string) {
 	h.AssertStatusCode(response, http.StatusBadRequest)
-	h.AssertErrorResponse(response, "")
 
-	// Проверяем, что в ошибке упоминается проблемное поле
-	var errorResp struct {
-		Details string `json:"details"`
-	}
+	var errorResp errorResponseBody
 	h.UnmarshalResponse(response, &errorResp)
+	h.assertErrorCode(errorResp, "")
 
+	// Проверяем, что в ошибке упоминается проблемное поле
 	// В зависимости от реализации валидации, проверяем наличие поля в details
 	// Это может потребовать доработки в зависимости от используемой библиотеки валидации
 }
 
-// WaitForCondition ждет выполнения условия с таймаутом
+// WaitForCondition ждет выполнения условия с таймаутом. Условие проверяется
+// сразу, а затем с растущим интервалом (см. nextPollDelay)
 func WaitForCondition(t *testing.T, condition func() bool, timeout time.Duration, message string) {
-	ticker := time.NewTicker(100 * time.Millisecond)
-	defer ticker.Stop()
+	deadline := time.NewTimer(timeout)
+	defer deadline.Stop()
 
-	timeoutChan := time.After(timeout)
+	delay := pollInitialDelay
+	timer := time.NewTimer(delay)
+	defer timer.Stop()
 
 	for {
+		if condition() {
+			return
+		}
+
 		select {
-		case <-ticker.C:
-			if condition() {
-				return
-			}
-		case <-timeoutChan:
+		case <-deadline.C:
 			t.Fatalf("Timeout waiting for condition: %s", message)
+		case <-timer.C:
 		}
+
+		delay = nextPollDelay(delay)
+		timer.Reset(delay)
 	}
 }
 
@@ -216,27 +322,20 @@ func AssertLocationInBounds(t *testing.T, lat, lon, centerLat, centerLon, radius
 	}
 }
 
-// LoadTestData загружает тестовые данные из JSON файла
-func LoadTestData(t *testing.T, filename string, target interface{}) {
-	// В реальном проекте здесь можно загружать данные из fixtures файлов
-	// Пока оставляем заглушку
-	t.Logf("Loading test data from %s", filename)
-}
-
 // CompareJSONObjects сравнивает два JSON объекта
 func CompareJSONObjects(t *testing.T, expected, actual interface{}) {
-	expectedBytes, err := json.Marshal(expected)
+	expectedBytes, err := gojson.Marshal(expected)
 	require.NoError(t, err)
 
-	actualBytes, err := json.Marshal(actual)
+	actualBytes, err := gojson.Marshal(actual)
 	require.NoError(t, err)
 
 	var expectedMap, actualMap map[string]interface{}
 
-	err = json.Unmarshal(expectedBytes, &expectedMap)
+	err = gojson.Unmarshal(expectedBytes, &expectedMap)
 	require.NoError(t, err)
 
-	err = json.Unmarshal(actualBytes, &actualMap)
+	err = gojson.Unmarshal(actualBytes, &actualMap)
 	require.NoError(t, err)
 
 	// Рекурсивное сравнение (упрощенная версия)
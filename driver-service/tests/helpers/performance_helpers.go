@@ -7,6 +7,7 @@ import (
 	"fmt"
 	"runtime"
 	"sync"
+	"sync/atomic"
 	"testing"
 	"time"
 
@@ -23,6 +24,11 @@ type PerformanceTestHelper struct {
 	t               *testing.T
 	driverService   services.DriverService
 	locationService services.LocationService
+
+	// Паузы, имитирующие поведение клиентов. Настраиваются через окружение,
+	// чтобы при стресс-прогонах их можно было сократить или отключить
+	thinkTime  time.Duration
+	levelPause time.Duration
 }
 
 // NewPerformanceTestHelper создает новый PerformanceTestHelper
@@ -31,6 +37,10 @@ func NewPerformanceTestHelper(t *testing.T, driverService services.DriverService
 		t:               t,
 		driverService:   driverService,
 		locationService: locationService,
+		thinkTime:       getEnvDurationOrDefault("TEST_PERF_THINK_TIME", 10*time.Millisecond),
+		// По умолчанию без паузы: BenchmarkLocationUpdates возвращается только после
+		// завершения всех воркеров, так что следующий уровень не пересекается с предыдущим
+		levelPause: getEnvDurationOrDefault("TEST_PERF_LEVEL_PAUSE", 0),
 	}
 }
 
@@ -48,6 +58,16 @@ type BenchmarkResult struct {
 func (h *PerformanceTestHelper) BenchmarkDriverCreation(ctx context.Context, count int, concurrency int) *BenchmarkResult {
 	h.t.Logf("Benchmarking driver creation: %d drivers with %d concurrent workers", count, concurrency)
 
+	// Готовим данные водителей заранее, чтобы их генерация не попадала в замер
+	drivers := make([]*entities.Driver, count)
+	for i := range drivers {
+		driver := fixtures.CreateTestDriver()
+		driver.Phone = fmt.Sprintf("+7900123%04d", i)
+		driver.Email = fmt.Sprintf("driver%d@example.com", i)
+		driver.LicenseNumber = fmt.Sprintf("TEST%06d", i)
+		drivers[i] = driver
+	}
+
 	start := time.Now()
 
 	// Канал для задач
@@ -61,12 +81,7 @@ func (h *PerformanceTestHelper) BenchmarkDriverCreation(ctx context.Context, cou
 		go func(workerID int) {
 			defer wg.Done()
 			for jobID := range jobs {
-				driver := fixtures.CreateTestDriver()
-				driver.Phone = fmt.Sprintf("+7900123%04d", jobID)
-				driver.Email = fmt.Sprintf("driver%d@example.com", jobID)
-				driver.LicenseNumber = fmt.Sprintf("TEST%06d", jobID)
-
-				_, err := h.driverService.CreateDriver(ctx, driver)
+				_, err := h.driverService.CreateDriver(ctx, drivers[jobID])
 				results <- err
 			}
 		}(i)
@@ -128,7 +143,7 @@ func (h *PerformanceTestHelper) BenchmarkLocationUpdates(ctx context.Context, dr
 				location := fixtures.CreateTestLocation(driverID)
 				location.Latitude += float64(jobID) * 0.0001 // Небольшие изменения координат
 				location.Longitude += float64(jobID) * 0.0001
-				location.RecordedAt = time.Now().Add(time.Duration(jobID) * time.Second)
+				location.RecordedAt = start.Add(time.Duration(jobID) * time.Second)
 
 				err := h.locationService.UpdateLocation(ctx, location)
 				results <- err
@@ -176,28 +191,42 @@ func (h *PerformanceTestHelper) BenchmarkLocationUpdates(ctx context.Context, dr
 func (h *PerformanceTestHelper) BenchmarkBatchLocationUpdates(ctx context.Context, driverID uuid.UUID, batchSize int, batchCount int) *BenchmarkResult {
 	h.t.Logf("Benchmarking batch location updates: %d batches of %d locations", batchCount, batchSize)
 
-	start := time.Now()
-	errors := 0
 	totalOperations := batchCount * batchSize
 
-	for i := 0; i < batchCount; i++ {
-		locations := fixtures.CreateTestLocationHistory(driverID, batchSize, 1*time.Second)
+	// Генерируем все батчи до начала замера, сдвигая времена от одной базовой точки
+	now := time.Now()
+	batches := make([][]*entities.DriverLocation, batchCount)
+	for i := range batches {
+		baseTime := now.Add(time.Duration(i*batchSize) * time.Second)
+		batches[i] = fixtures.CreateTestLocationHistoryFrom(driverID, baseTime, batchSize, 1*time.Second)
+	}
 
-		// Сдвигаем времена для каждого батча
-		baseTime := time.Now().Add(time.Duration(i*batchSize) * time.Second)
-		for j, location := range locations {
-			location.RecordedAt = baseTime.Add(time.Duration(j) * time.Second)
-			location.CreatedAt = location.RecordedAt
-		}
+	start := time.Now()
+
+	// Батчи отправляются одновременно, а результаты собираются после: пока
+	// PostgreSQL вставляет один батч, следующие уже передаются по другим
+	// соединениям пула. Каждая горутина пишет только в свой элемент batchErrors
+	batchErrors := make([]error, batchCount)
+	var wg sync.WaitGroup
+	for i, locations := range batches {
+		wg.Add(1)
+		go func(i int, locations []*entities.DriverLocation) {
+			defer wg.Done()
+			batchErrors[i] = h.locationService.BatchUpdateLocations(ctx, locations)
+		}(i, locations)
+	}
+	wg.Wait()
 
-		err := h.locationService.BatchUpdateLocations(ctx, locations)
+	totalTime := time.Since(start)
+
+	errors := 0
+	for _, err := range batchErrors {
 		if err != nil {
 			errors++
 			h.t.Logf("Batch update error: %v", err)
 		}
 	}
 
-	totalTime := time.Since(start)
 	avgTime := totalTime / time.Duration(totalOperations)
 	opsPerSecond := float64(totalOperations) / totalTime.Seconds()
 
@@ -218,27 +247,50 @@ func (h *PerformanceTestHelper) BenchmarkBatchLocationUpdates(ctx context.Contex
 func (h *PerformanceTestHelper) BenchmarkNearbyDriversSearch(ctx context.Context, searchCount int, driversCount int) *BenchmarkResult {
 	h.t.Logf("Benchmarking nearby drivers search: %d searches among %d drivers", searchCount, driversCount)
 
-	// Подготавливаем данные - создаем водителей с местоположениями
+	// Подготавливаем данные - создаем водителей параллельно. Каждый воркер
+	// заполняет свою часть driverIDs, поэтому синхронизация не нужна
+	const setupWorkers = 10
 	driverIDs := make([]uuid.UUID, driversCount)
-	for i := 0; i < driversCount; i++ {
-		driver := fixtures.CreateTestDriver()
-		driver.Phone = fmt.Sprintf("+7900%07d", i)
-		driver.Email = fmt.Sprintf("perf_driver%d@example.com", i)
-		driver.LicenseNumber = fmt.Sprintf("PERF%06d", i)
+	setupErrors := make([]error, setupWorkers)
 
-		createdDriver, err := h.driverService.CreateDriver(ctx, driver)
+	var wg sync.WaitGroup
+	for w := 0; w < setupWorkers; w++ {
+		wg.Add(1)
+		go func(workerID int) {
+			defer wg.Done()
+			for i := workerID; i < driversCount; i += setupWorkers {
+				driver := fixtures.CreateTestDriver()
+				driver.Phone = fmt.Sprintf("+7900%07d", i)
+				driver.Email = fmt.Sprintf("perf_driver%d@example.com", i)
+				driver.LicenseNumber = fmt.Sprintf("PERF%06d", i)
+
+				createdDriver, err := h.driverService.CreateDriver(ctx, driver)
+				if err != nil {
+					setupErrors[workerID] = err
+					return
+				}
+				driverIDs[i] = createdDriver.ID
+			}
+		}(w)
+	}
+	wg.Wait()
+
+	for _, err := range setupErrors {
 		require.NoError(h.t, err)
-		driverIDs[i] = createdDriver.ID
+	}
 
-		// Добавляем местоположение в случайном месте в радиусе 10км от центра
-		location := fixtures.CreateTestLocation(createdDriver.ID)
+	// Добавляем местоположения всех водителей одним пакетом в радиусе 10км от центра
+	locations := make([]*entities.DriverLocation, driversCount)
+	for i, driverID := range driverIDs {
+		location := fixtures.CreateTestLocation(driverID)
 		location.Latitude = 55.7558 + (float64(i%100)-50)*0.001 // Разброс ±50*0.001 градуса
 		location.Longitude = 37.6173 + (float64(i%100)-50)*0.001
-
-		err = h.locationService.UpdateLocation(ctx, location)
-		require.NoError(h.t, err)
+		locations[i] = location
 	}
 
+	err := h.locationService.BatchUpdateLocations(ctx, locations)
+	require.NoError(h.t, err)
+
 	// Выполняем бенчмарк поиска
 	start := time.Now()
 	errors := 0
@@ -277,12 +329,16 @@ func (h *PerformanceTestHelper) LoadTest(ctx context.Context, driverID uuid.UUID
 	h.t.Logf("Load testing for %v with %d concurrent workers", duration, concurrency)
 
 	start := time.Now()
-	endTime := start.Add(duration)
 
-	// Счетчики
+	// Окончание теста отмечается закрытием канала, чтобы воркеры
+	// не вызывали time.Now() на каждой итерации
+	done := make(chan struct{})
+	timer := time.AfterFunc(duration, func() { close(done) })
+	defer timer.Stop()
+
+	// Счетчики (атомарные, чтобы воркеры не конкурировали за мьютекс на каждой операции)
 	var totalOps int64
 	var errors int64
-	var mu sync.Mutex
 
 	// Запускаем воркеры
 	var wg sync.WaitGroup
@@ -291,45 +347,56 @@ func (h *PerformanceTestHelper) LoadTest(ctx context.Context, driverID uuid.UUID
 		go func(workerID int) {
 			defer wg.Done()
 
-			opCounter := 0
-			for time.Now().Before(endTime) {
-				// Чередуем операции
-				switch opCounter % 3 {
-				case 0:
-					// Обновление местоположения
-					location := fixtures.CreateTestLocation(driverID)
+			// Шаблон местоположения создается один раз на воркер;
+			// ID и время создания назначает сервис
+			template := *fixtures.CreateTestLocation(driverID)
+			template.ID = uuid.Nil
+			template.CreatedAt = time.Time{}
+
+			// Таблица операций строится один раз на воркер; операции чередуются
+			// по индексу, вес операции задается числом ее вхождений в таблицу
+			operations := []func(opCounter int) error{
+				// Обновление местоположения
+				func(opCounter int) error {
+					location := template
 					location.Latitude += float64(opCounter) * 0.0001
-					err := h.locationService.UpdateLocation(ctx, location)
-					if err != nil {
-						mu.Lock()
-						errors++
-						mu.Unlock()
-					}
-				case 1:
-					// Получение текущего местоположения
+					location.RecordedAt = time.Now()
+					return h.locationService.UpdateLocation(ctx, &location)
+				},
+				// Получение текущего местоположения
+				func(int) error {
 					_, err := h.locationService.GetCurrentLocation(ctx, driverID)
-					if err != nil && err != entities.ErrLocationNotFound {
-						mu.Lock()
-						errors++
-						mu.Unlock()
+					if err == entities.ErrLocationNotFound {
+						return nil
 					}
-				case 2:
-					// Получение водителя
+					return err
+				},
+				// Получение водителя
+				func(int) error {
 					_, err := h.driverService.GetDriverByID(ctx, driverID)
-					if err != nil {
-						mu.Lock()
-						errors++
-						mu.Unlock()
-					}
+					return err
+				},
+			}
+
+			opCounter := 0
+			for {
+				select {
+				case <-done:
+					return
+				default:
+				}
+
+				if err := operations[opCounter%len(operations)](opCounter); err != nil {
+					atomic.AddInt64(&errors, 1)
 				}
 
-				mu.Lock()
-				totalOps++
-				mu.Unlock()
+				atomic.AddInt64(&totalOps, 1)
 				opCounter++
 
 				// Небольшая пауза для имитации реальной нагрузки
-				time.Sleep(10 * time.Millisecond)
+				if h.thinkTime > 0 {
+					time.Sleep(h.thinkTime)
+				}
 			}
 		}(i)
 	}
@@ -458,7 +525,9 @@ func (h *PerformanceTestHelper) StressTest(ctx context.Context, driverID uuid.UU
 		}
 
 		// Пауза между уровнями нагрузки
-		time.Sleep(1 * time.Second)
+		if h.levelPause > 0 {
+			time.Sleep(h.levelPause)
+		}
 	}
 }
 
@@ -487,8 +556,10 @@ func (h *PerformanceTestHelper) DatabaseConnectionPoolTest(ctx context.Context,
 					errors <- err
 				}
 
-				// Небольшая пауза
-				time.Sleep(10 * time.Millisecond)
+				// Пауза между запросами воркера, как в LoadTest
+				if h.thinkTime > 0 {
+					time.Sleep(h.thinkTime)
+				}
 			}
 		}(i)
 	}
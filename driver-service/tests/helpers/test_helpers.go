@@ -4,9 +4,16 @@ package helpers
 
 import (
 	"context"
+	"crypto/sha256"
 	"database/sql"
+	"encoding/hex"
 	"fmt"
 	"os"
+	"path/filepath"
+	"sort"
+	"strconv"
+	"strings"
+	"sync"
 	"testing"
 	"time"
 
@@ -16,10 +23,16 @@ import (
 	"github.com/golang-migrate/migrate/v4"
 	"github.com/golang-migrate/migrate/v4/database/postgres"
 	_ "github.com/golang-migrate/migrate/v4/source/file"
+	"github.com/google/uuid"
+	"github.com/lib/pq"
 	"go.uber.org/zap"
+	"go.uber.org/zap/zapcore"
 	"go.uber.org/zap/zaptest"
 )
 
+// migrationsDir каталог с файлами миграций
+const migrationsDir = "internal/infrastructure/database/migrations"
+
 // TestDB структура для тестовой базы данных
 type TestDB struct {
 	*database.DB
@@ -29,7 +42,7 @@ type TestDB struct {
 
 // SetupTestDB создает тестовую базу данных
 func SetupTestDB(t *testing.T) *TestDB {
-	logger := zaptest.NewLogger(t)
+	logger := CreateTestLogger(t)
 
 	// Получаем конфигурацию для тестов
 	cfg := getTestConfig()
@@ -38,22 +51,32 @@ func SetupTestDB(t *testing.T) *TestDB {
 	testDBName := fmt.Sprintf("test_%s_%d", t.Name(), time.Now().Unix())
 	testDBName = sanitizeDBName(testDBName)
 
-	// Подключаемся к основной БД для создания тестовой
-	mainDB, err := sql.Open("postgres", fmt.Sprintf(
-		"host=%s port=%d user=%s password=%s dbname=postgres sslmode=%s",
-		cfg.Database.Host, cfg.Database.Port, cfg.Database.User, cfg.Database.Password, cfg.Database.SSLMode,
-	))
+	// Используем общее подключение к основной БД для создания тестовой
+	mainDB, err := getMainDB(cfg)
 	if err != nil {
 		t.Fatalf("Failed to connect to main database: %v", err)
 	}
-	defer mainDB.Close()
 
-	// Создаем тестовую базу данных
-	_, err = mainDB.Exec(fmt.Sprintf("CREATE DATABASE %s", testDBName))
+	// Получаем шаблонную БД с примененными миграциями (создается при первом обращении)
+	templateName, err := getTemplateDB(cfg, mainDB, logger)
+	if err != nil {
+		t.Fatalf("Failed to prepare template database: %v", err)
+	}
+
+	// Создаем тестовую базу данных копированием шаблона
+	_, err = mainDB.Exec(fmt.Sprintf("CREATE DATABASE %s TEMPLATE %s", testDBName, templateName))
 	if err != nil {
 		t.Fatalf("Failed to create test database: %v", err)
 	}
 
+	// Тестовая БД одноразовая, поэтому коммиты не ждут сброса WAL на диск.
+	// Настройка действует на новые сессии, поэтому задается до подключения;
+	// из шаблона она не копируется и выставляется для каждой БД
+	_, err = mainDB.Exec(fmt.Sprintf("ALTER DATABASE %s SET synchronous_commit = off", testDBName))
+	if err != nil {
+		t.Fatalf("Failed to configure test database: %v", err)
+	}
+
 	// Подключаемся к тестовой БД
 	cfg.Database.Database = testDBName
 	testDB, err := database.NewPostgresDB(&cfg.Database, logger)
@@ -61,11 +84,6 @@ func SetupTestDB(t *testing.T) *TestDB {
 		t.Fatalf("Failed to connect to test database: %v", err)
 	}
 
-	// Выполняем миграции
-	if err := runTestMigrations(testDB.DB.DB, logger); err != nil {
-		t.Fatalf("Failed to run test migrations: %v", err)
-	}
-
 	logger.Info("Test database created",
 		zap.String("db_name", testDBName),
 	)
@@ -89,29 +107,16 @@ func (tdb *TestDB) TeardownTestDB(t *testing.T) {
 	// Получаем конфигурацию
 	cfg := getTestConfig()
 
-	// Подключаемся к основной БД для удаления тестовой
-	mainDB, err := sql.Open("postgres", fmt.Sprintf(
-		"host=%s port=%d user=%s password=%s dbname=postgres sslmode=%s",
-		cfg.Database.Host, cfg.Database.Port, cfg.Database.User, cfg.Database.Password, cfg.Database.SSLMode,
-	))
+	// Используем общее подключение к основной БД для удаления тестовой
+	mainDB, err := getMainDB(cfg)
 	if err != nil {
 		t.Errorf("Failed to connect to main database for cleanup: %v", err)
 		return
 	}
-	defer mainDB.Close()
 
-	// Закрываем все соединения к тестовой БД
-	_, err = mainDB.Exec(fmt.Sprintf(`
-		SELECT pg_terminate_backend(pid)
-		FROM pg_stat_activity
-		WHERE datname = '%s' AND pid <> pg_backend_pid()
-	`, tdb.dbName))
-	if err != nil {
-		t.Logf("Warning: Failed to terminate connections to test database: %v", err)
-	}
-
-	// Удаляем тестовую базу данных
-	_, err = mainDB.Exec(fmt.Sprintf("DROP DATABASE IF EXISTS %s", tdb.dbName))
+	// Удаляем тестовую базу данных. WITH (FORCE) (PostgreSQL 13+) сам закрывает
+	// оставшиеся соединения, поэтому отдельный pg_terminate_backend не нужен
+	_, err = mainDB.Exec(fmt.Sprintf("DROP DATABASE IF EXISTS %s WITH (FORCE)", tdb.dbName))
 	if err != nil {
 		t.Errorf("Failed to drop test database: %v", err)
 	} else {
@@ -119,37 +124,83 @@ func (tdb *TestDB) TeardownTestDB(t *testing.T) {
 	}
 }
 
+// dependentTables таблицы, ссылающиеся на drivers
+var dependentTables = []string{
+	"driver_ratings",
+	"driver_rating_stats",
+	"driver_locations",
+	"driver_shifts",
+	"driver_documents",
+}
+
+// truncateDependentQuery и truncateAllQuery собираются один раз: все таблицы
+// очищаются одним TRUNCATE, то есть одним запросом и одной блокировкой на набор
+var (
+	truncateDependentQuery = "TRUNCATE TABLE " + strings.Join(dependentTables, ", ") + " CASCADE"
+	truncateAllQuery       = "TRUNCATE TABLE " + strings.Join(dependentTables, ", ") + ", drivers CASCADE"
+)
+
 // CleanupTables очищает все таблицы в тестовой БД
 func (tdb *TestDB) CleanupTables(t *testing.T) {
-	tables := []string{
-		"driver_ratings",
-		"driver_rating_stats",
-		"driver_locations",
-		"driver_shifts",
-		"driver_documents",
-		"drivers",
+	if _, err := tdb.DB.Exec(truncateAllQuery); err != nil {
+		t.Errorf("Failed to truncate tables: %v", err)
 	}
+}
 
-	for _, table := range tables {
-		_, err := tdb.DB.Exec(fmt.Sprintf("TRUNCATE TABLE %s CASCADE", table))
-		if err != nil {
-			t.Errorf("Failed to truncate table %s: %v", table, err)
-		}
+// CleanupTablesKeepDrivers очищает таблицы, сохраняя указанных водителей.
+// Используется suite'ами, которые создают базовых водителей один раз в SetupSuite
+// и только читают их в тестах: удаляются зависимые данные и водители, созданные в тестах.
+func (tdb *TestDB) CleanupTablesKeepDrivers(t *testing.T, keep ...uuid.UUID) {
+	if _, err := tdb.DB.Exec(truncateDependentQuery); err != nil {
+		t.Errorf("Failed to truncate tables: %v", err)
+	}
+
+	ids := make([]string, len(keep))
+	for i, id := range keep {
+		ids[i] = id.String()
+	}
+
+	// Массив передается одним параметром и приводится к uuid[], поэтому
+	// сравнение идет по самому id, без приведения каждой строки к тексту
+	_, err := tdb.DB.Exec("DELETE FROM drivers WHERE NOT (id = ANY($1::uuid[]))", pq.StringArray(ids))
+	if err != nil {
+		t.Errorf("Failed to cleanup drivers: %v", err)
 	}
 }
 
-// getTestConfig возвращает конфигурацию для тестов
+var (
+	testConfigOnce sync.Once
+	testConfig     config.Config
+)
+
+// getTestConfig возвращает копию конфигурации для тестов.
+// Базовая конфигурация строится из окружения один раз; вызывающий код
+// может изменять полученную копию (например, имя БД)
 func getTestConfig() *config.Config {
-	cfg := &config.Config{
+	testConfigOnce.Do(func() {
+		testConfig = buildTestConfig()
+	})
+
+	cfg := testConfig
+	return &cfg
+}
+
+// buildTestConfig строит конфигурацию для тестов из переменных окружения
+func buildTestConfig() config.Config {
+	// Пул рассчитан на параллельных воркеров нагрузочных тестов; idle = open,
+	// чтобы соединения не закрывались между волнами запросов
+	maxConns := getEnvIntOrDefault("TEST_DB_MAX_CONNS", 20)
+
+	cfg := config.Config{
 		Database: config.DatabaseConfig{
 			Host:            getEnvOrDefault("TEST_DB_HOST", "localhost"),
-			Port:            5432,
+			Port:            getEnvIntOrDefault("TEST_DB_PORT", 5432),
 			User:            getEnvOrDefault("TEST_DB_USER", "postgres"),
 			Password:        getEnvOrDefault("TEST_DB_PASSWORD", "postgres"),
 			Database:        "postgres", // Будет заменено на тестовую БД
 			SSLMode:         "disable",
-			MaxOpenConns:    5,
-			MaxIdleConns:    5,
+			MaxOpenConns:    maxConns,
+			MaxIdleConns:    maxConns,
 			ConnMaxLifetime: 5 * time.Minute,
 		},
 		Server: config.ServerConfig{
@@ -169,6 +220,165 @@ func getTestConfig() *config.Config {
 	return cfg
 }
 
+var (
+	mainDBOnce sync.Once
+	mainDBPool *sql.DB
+	mainDBErr  error
+)
+
+// getMainDB возвращает пул подключений к служебной БД postgres, общий для всех
+// suite'ов пакета. Подключение открывается и проверяется один раз, а не в каждом
+// SetupTestDB/TeardownTestDB; пул закрывается вместе с процессом тестов.
+// Ожидание готовности (WaitForDB) ограничено TEST_DB_PROBE_TIMEOUT, а его ошибка
+// запоминается: если PostgreSQL недоступен, остальные suite'ы падают сразу,
+// без повторных попыток
+func getMainDB(cfg *config.Config) (*sql.DB, error) {
+	mainDBOnce.Do(func() {
+		db, err := sql.Open("postgres", mainDBDSN(cfg))
+		if err != nil {
+			mainDBErr = err
+			return
+		}
+
+		probeTimeout := getEnvDurationOrDefault("TEST_DB_PROBE_TIMEOUT", 2*time.Second)
+		if err := WaitForDB(db, probeTimeout); err != nil {
+			db.Close()
+			mainDBErr = fmt.Errorf("PostgreSQL is not available at %s:%d: %w",
+				cfg.Database.Host, cfg.Database.Port, err)
+			return
+		}
+		mainDBPool = db
+	})
+	return mainDBPool, mainDBErr
+}
+
+var (
+	templateOnce sync.Once
+	templateName string
+	templateErr  error
+)
+
+// getTemplateDB возвращает имя шаблонной БД с примененными миграциями.
+// Шаблон создается лениво при первом вызове и переиспользуется между запусками,
+// пока не изменятся файлы миграций: имя содержит хеш их содержимого
+func getTemplateDB(cfg *config.Config, mainDB *sql.DB, logger *zap.Logger) (string, error) {
+	templateOnce.Do(func() {
+		templateName, templateErr = createTemplateDB(cfg, mainDB, logger)
+	})
+	return templateName, templateErr
+}
+
+// createTemplateDB создает шаблонную БД, если она еще не существует
+func createTemplateDB(cfg *config.Config, mainDB *sql.DB, logger *zap.Logger) (string, error) {
+	hash, err := migrationsHash()
+	if err != nil {
+		return "", err
+	}
+	name := "test_template_" + hash
+
+	exists, err := databaseExists(mainDB, name)
+	if err != nil {
+		return "", err
+	}
+	if exists {
+		return name, nil
+	}
+
+	// Миграции выполняются во временной БД, которая затем переименовывается:
+	// прерванный запуск не оставит недоделанный шаблон под итоговым именем
+	tmpName := fmt.Sprintf("%s_%d", name, time.Now().UnixNano())
+	if _, err := mainDB.Exec(fmt.Sprintf("CREATE DATABASE %s", tmpName)); err != nil {
+		return "", fmt.Errorf("failed to create template database: %w", err)
+	}
+
+	// Если временная БД не стала шаблоном, удаляем ее, чтобы не оставлять
+	// осиротевшие базы на общем сервере
+	renamed := false
+	defer func() {
+		if renamed {
+			return
+		}
+		if _, err := mainDB.Exec(fmt.Sprintf("DROP DATABASE IF EXISTS %s WITH (FORCE)", tmpName)); err != nil {
+			logger.Warn("Failed to drop temporary template database",
+				zap.String("db_name", tmpName),
+				zap.Error(err),
+			)
+		}
+	}()
+
+	tmpCfg := cfg.Database
+	tmpCfg.Database = tmpName
+	tmpDB, err := database.NewPostgresDB(&tmpCfg, logger)
+	if err != nil {
+		return "", fmt.Errorf("failed to connect to template database: %w", err)
+	}
+
+	err = runTestMigrations(tmpDB.DB.DB, logger)
+	tmpDB.Close()
+	if err != nil {
+		return "", err
+	}
+
+	// PostgreSQL не копирует и не переименовывает БД с активными подключениями
+	if err := terminateConnections(mainDB, tmpName); err != nil {
+		return "", fmt.Errorf("failed to terminate template connections: %w", err)
+	}
+
+	if _, err := mainDB.Exec(fmt.Sprintf("ALTER DATABASE %s RENAME TO %s", tmpName, name)); err != nil {
+		// Шаблон мог быть создан параллельным запуском: тогда используем его,
+		// а временную БД удалит отложенная очистка
+		if exists, checkErr := databaseExists(mainDB, name); checkErr == nil && exists {
+			return name, nil
+		}
+		return "", fmt.Errorf("failed to rename template database: %w", err)
+	}
+	renamed = true
+
+	logger.Info("Template database created", zap.String("db_name", name))
+	return name, nil
+}
+
+// databaseExists проверяет, существует ли БД с указанным именем
+func databaseExists(mainDB *sql.DB, name string) (bool, error) {
+	var exists bool
+	err := mainDB.QueryRow("SELECT EXISTS(SELECT 1 FROM pg_database WHERE datname = $1)", name).Scan(&exists)
+	if err != nil {
+		return false, fmt.Errorf("failed to check template database: %w", err)
+	}
+	return exists, nil
+}
+
+// migrationsHash возвращает короткий хеш содержимого файлов миграций
+func migrationsHash() (string, error) {
+	files, err := filepath.Glob(filepath.Join(migrationsDir, "*.sql"))
+	if err != nil {
+		return "", fmt.Errorf("failed to list migrations: %w", err)
+	}
+	sort.Strings(files)
+
+	h := sha256.New()
+	for _, file := range files {
+		content, err := os.ReadFile(file)
+		if err != nil {
+			return "", fmt.Errorf("failed to read migration %s: %w", file, err)
+		}
+		h.Write([]byte(filepath.Base(file)))
+		h.Write(content)
+	}
+
+	return hex.EncodeToString(h.Sum(nil))[:16], nil
+}
+
+// terminateConnections закрывает все соединения к указанной БД
+func terminateConnections(mainDB *sql.DB, dbName string) error {
+	_, err := mainDB.Exec(`
+		SELECT pg_terminate_backend(pid)
+		FROM pg_stat_activity
+		WHERE datname = $1 AND pid <> pg_backend_pid()
+	`, dbName)
+	return err
+}
+
 // runTestMigrations выполняет миграции для тестовой БД
 func runTestMigrations(db *sql.DB, logger *zap.Logger) error {
 	driver, err := postgres.WithInstance(db, &postgres.Config{})
@@ -176,7 +386,7 @@ func runTestMigrations(db *sql.DB, logger *zap.Logger) error {
 		return fmt.Errorf("failed to create migration driver: %w", err)
 	}
 
-	migrationsPath := "file://internal/infrastructure/database/migrations"
+	migrationsPath := "file://" + migrationsDir
 	m, err := migrate.NewWithDatabaseInstance(migrationsPath, "postgres", driver)
 	if err != nil {
 		return fmt.Errorf("failed to create migration instance: %w", err)
@@ -198,6 +408,34 @@ func getEnvOrDefault(key, defaultValue string) string {
 	return defaultValue
 }
 
+// getEnvIntOrDefault получает целочисленную переменную окружения или возвращает значение по умолчанию
+func getEnvIntOrDefault(key string, defaultValue int) int {
+	if value := os.Getenv(key); value != "" {
+		if parsed, err := strconv.Atoi(value); err == nil {
+			return parsed
+		}
+	}
+	return defaultValue
+}
+
+// getEnvDurationOrDefault получает длительность из переменной окружения или возвращает значение по умолчанию
+func getEnvDurationOrDefault(key string, defaultValue time.Duration) time.Duration {
+	if value := os.Getenv(key); value != "" {
+		if parsed, err := time.ParseDuration(value); err == nil {
+			return parsed
+		}
+	}
+	return defaultValue
+}
+
+// mainDBDSN возвращает строку подключения к служебной БД postgres
+func mainDBDSN(cfg *config.Config) string {
+	return fmt.Sprintf(
+		"host=%s port=%d user=%s password=%s dbname=postgres sslmode=%s",
+		cfg.Database.Host, cfg.Database.Port, cfg.Database.User, cfg.Database.Password, cfg.Database.SSLMode,
+	)
+}
+
 // sanitizeDBName очищает имя базы данных от недопустимых символов
 func sanitizeDBName(name string) string {
 	// Заменяем недопустимые символы на подчеркивания
@@ -231,27 +469,106 @@ func sanitizeDBName(name string) string {
 	return result
 }
 
-// WaitForDB ждет доступности базы данных
-func WaitForDB(db *database.DB, timeout time.Duration) error {
+// Интервалы опроса в WaitForDB и WaitForCondition: первая повторная проверка
+// через pollInitialDelay, затем интервал растет в 1.5 раза до pollMaxDelay.
+// Готовое условие обнаруживается за миллисекунды, а долгое ожидание не
+// превращается в частый опрос
+const (
+	pollInitialDelay = 25 * time.Millisecond
+	pollMaxDelay     = 500 * time.Millisecond
+)
+
+// nextPollDelay возвращает следующий интервал опроса
+func nextPollDelay(delay time.Duration) time.Duration {
+	delay = delay * 3 / 2
+	if delay > pollMaxDelay {
+		return pollMaxDelay
+	}
+	return delay
+}
+
+// Pinger пул подключений, доступность которого можно проверить
+// (*sql.DB, *database.DB)
+type Pinger interface {
+	PingContext(ctx context.Context) error
+}
+
+// WaitForDB ждет доступности базы данных. Используется getMainDB, так что
+// стартующий PostgreSQL дожидаются, а не отказывают с первой попытки. Проверки
+// идут через пул db, так что после первого успешного соединения оно
+// переиспользуется, а каждая проверка ограничена общим таймаутом
+func WaitForDB(db Pinger, timeout time.Duration) error {
 	ctx, cancel := context.WithTimeout(context.Background(), timeout)
 	defer cancel()
 
-	ticker := time.NewTicker(100 * time.Millisecond)
-	defer ticker.Stop()
+	delay := pollInitialDelay
+	timer := time.NewTimer(delay)
+	defer timer.Stop()
 
 	for {
+		// Первая проверка выполняется сразу, без ожидания
+		err := db.PingContext(ctx)
+		if err == nil {
+			return nil
+		}
+
 		select {
 		case <-ctx.Done():
-			return fmt.Errorf("database not ready within %v", timeout)
-		case <-ticker.C:
-			if err := db.Health(); err == nil {
-				return nil
-			}
+			return fmt.Errorf("database not ready within %v: %w", timeout, err)
+		case <-timer.C:
+		}
+
+		delay = nextPollDelay(delay)
+		timer.Reset(delay)
+	}
+}
+
+// RunConcurrently вызывает fn для индексов [0, count) не более чем в workers
+// горутинах и проверяет, что все вызовы завершились без ошибок. Используется для
+// подготовки данных, где каждая операция - отдельный round-trip в БД
+func RunConcurrently(t *testing.T, count, workers int, fn func(i int) error) {
+	errs := make([]error, count)
+	sem := make(chan struct{}, workers)
+
+	var wg sync.WaitGroup
+	for i := 0; i < count; i++ {
+		wg.Add(1)
+		sem <- struct{}{}
+		go func(i int) {
+			defer wg.Done()
+			defer func() { <-sem }()
+			errs[i] = fn(i)
+		}(i)
+	}
+	wg.Wait()
+
+	for i, err := range errs {
+		if err != nil {
+			t.Fatalf("Concurrent operation %d failed: %v", i, err)
 		}
 	}
 }
 
+var (
+	testLogLevelOnce sync.Once
+	testLogLevel     zapcore.Level
+)
+
+// getTestLogLevel возвращает уровень логов тестов из TEST_LOG_LEVEL (по умолчанию info).
+// Debug-записи сервисов пишутся на каждую операцию и в нагрузочных тестах
+// копятся в буфере t.Log, поэтому включаются только по запросу
+func getTestLogLevel() zapcore.Level {
+	testLogLevelOnce.Do(func() {
+		level, err := zapcore.ParseLevel(getEnvOrDefault("TEST_LOG_LEVEL", "info"))
+		if err != nil {
+			level = zapcore.InfoLevel
+		}
+		testLogLevel = level
+	})
+	return testLogLevel
+}
+
 // CreateTestLogger создает логгер для тестов
 func CreateTestLogger(t *testing.T) *zap.Logger {
-	return zaptest.NewLogger(t, zaptest.Level(zap.DebugLevel))
+	return zaptest.NewLogger(t, zaptest.Level(getTestLogLevel()))
 }
@@ -36,6 +36,14 @@ func (suite *DocumentRepositoryTestSuite) SetupSuite() {
 	suite.documentRepo = repositories.NewDocumentRepository(suite.testDB.DB, logger)
 	suite.driverRepo = repositories.NewDriverRepository(suite.testDB.DB, logger)
 	suite.ctx = context.Background()
+
+	// Создаем тестового водителя один раз: тесты suite только привязывают к нему
+	// документы, а удаляющий водителя тест создает собственного
+	suite.testDB.CleanupTables(suite.T())
+	driver := fixtures.CreateTestDriver()
+	err := suite.driverRepo.Create(suite.ctx, driver)
+	require.NoError(suite.T(), err)
+	suite.testDriverID = driver.ID
 }
 
 // TearDownSuite выполняется один раз после всех тестов
@@ -45,13 +53,7 @@ func (suite *DocumentRepositoryTestSuite) TearDownSuite() {
 
 // SetupTest выполняется перед каждым тестом
 func (suite *DocumentRepositoryTestSuite) SetupTest() {
-	suite.testDB.CleanupTables(suite.T())
-
-	// Создаем тестового водителя
-	driver := fixtures.CreateTestDriver()
-	err := suite.driverRepo.Create(suite.ctx, driver)
-	require.NoError(suite.T(), err)
-	suite.testDriverID = driver.ID
+	suite.testDB.CleanupTablesKeepDrivers(suite.T(), suite.testDriverID)
 }
 
 // TestCreateDocument тестирует создание документа
@@ -392,10 +394,17 @@ func (suite *DocumentRepositoryTestSuite) TestDocumentUpdateWorkflow() {
 
 // TestDocumentCascadeDelete тестирует каскадное удаление документов при удалении водителя
 func (suite *DocumentRepositoryTestSuite) TestDocumentCascadeDelete() {
-	// Arrange
+	// Arrange - отдельный водитель, общий водитель suite не удаляется
+	driver := fixtures.CreateTestDriver()
+	driver.Phone = "+79001234569"
+	driver.Email = "cascade@example.com"
+	driver.LicenseNumber = "TEST123458"
+	err := suite.driverRepo.Create(suite.ctx, driver)
+	require.NoError(suite.T(), err)
+
 	documents := []*entities.DriverDocument{
-		fixtures.CreateTestDocument(suite.testDriverID, entities.DocumentTypeDriverLicense),
-		fixtures.CreateTestDocument(suite.testDriverID, entities.DocumentTypeMedicalCert),
+		fixtures.CreateTestDocument(driver.ID, entities.DocumentTypeDriverLicense),
+		fixtures.CreateTestDocument(driver.ID, entities.DocumentTypeMedicalCert),
 	}
 
 	for _, doc := range documents {
@@ -404,16 +413,16 @@ func (suite *DocumentRepositoryTestSuite) TestDocumentCascadeDelete() {
 	}
 
 	// Проверяем, что документы созданы
-	driverDocs, err := suite.documentRepo.GetByDriverID(suite.ctx, suite.testDriverID)
+	driverDocs, err := suite.documentRepo.GetByDriverID(suite.ctx, driver.ID)
 	require.NoError(suite.T(), err)
 	assert.Len(suite.T(), driverDocs, 2)
 
 	// Act - удаляем водителя (каскадное удаление документов)
-	err = suite.driverRepo.Delete(suite.ctx, suite.testDriverID)
+	err = suite.driverRepo.Delete(suite.ctx, driver.ID)
 	require.NoError(suite.T(), err)
 
 	// Assert - документы должны быть удалены
-	driverDocsAfter, err := suite.documentRepo.GetByDriverID(suite.ctx, suite.testDriverID)
+	driverDocsAfter, err := suite.documentRepo.GetByDriverID(suite.ctx, driver.ID)
 	require.NoError(suite.T(), err)
 	assert.Len(suite.T(), driverDocsAfter, 0)
 }
@@ -504,5 +513,6 @@ func (suite *DocumentRepositoryTestSuite) TestDocumentValidation() {
 
 // Запуск тестового suite
 func TestDocumentRepositoryTestSuite(t *testing.T) {
+	t.Parallel()
 	suite.Run(t, new(DocumentRepositoryTestSuite))
 }
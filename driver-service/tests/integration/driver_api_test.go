@@ -3,12 +3,9 @@
 package integration
 
 import (
-	"bytes"
 	"context"
 	"encoding/json"
-	"fmt"
 	"net/http"
-	"net/http/httptest"
 	"testing"
 	"time"
 
@@ -35,14 +32,12 @@ type DriverAPITestSuite struct {
 	server        *httpServer.Server
 	router        *gin.Engine
 	driverService services.DriverService
+	apiHelper     *helpers.APITestHelper
 	ctx           context.Context
 }
 
 // SetupSuite выполняется один раз перед всеми тестами
 func (suite *DriverAPITestSuite) SetupSuite() {
-	// Настройка тестового режима для Gin
-	gin.SetMode(gin.TestMode)
-
 	suite.testDB = helpers.SetupTestDB(suite.T())
 	logger := helpers.CreateTestLogger(suite.T())
 	suite.ctx = context.Background()
@@ -75,6 +70,10 @@ func (suite *DriverAPITestSuite) SetupSuite() {
 	// Создаем HTTP сервер
 	suite.server = httpServer.NewServer(cfg, logger, driverHandler, locationHandler)
 	suite.router = suite.server.GetRouter()
+
+	// Один APITestHelper на весь suite: сериализация тела и заголовки
+	// формируются в одном месте, а не в каждом тесте
+	suite.apiHelper = helpers.NewAPITestHelper(suite.router, suite.T())
 }
 
 // TearDownSuite выполняется один раз после всех тестов
@@ -102,19 +101,18 @@ func (suite *DriverAPITestSuite) TestCreateDriverAPI() {
 		"license_expiry":  "2026-12-31T00:00:00Z",
 	}
 
-	bodyBytes, _ := json.Marshal(requestBody)
-	req := httptest.NewRequest(http.MethodPost, "/api/v1/drivers", bytes.NewBuffer(bodyBytes))
-	req.Header.Set("Content-Type", "application/json")
-	w := httptest.NewRecorder()
-
 	// Act
-	suite.router.ServeHTTP(w, req)
+	w := suite.apiHelper.MakeRequest(helpers.APIRequest{
+		Method: http.MethodPost,
+		URL:    helpers.DriversURL,
+		Body:   requestBody,
+	})
 
 	// Assert
-	assert.Equal(suite.T(), http.StatusCreated, w.Code)
+	assert.Equal(suite.T(), http.StatusCreated, w.StatusCode)
 
 	var response httpHandlers.DriverResponse
-	err := json.Unmarshal(w.Body.Bytes(), &response)
+	err := json.Unmarshal(w.Body, &response)
 	require.NoError(suite.T(), err)
 
 	assert.Equal(suite.T(), "+79001234567", response.Phone)
@@ -123,57 +121,47 @@ func (suite *DriverAPITestSuite) TestCreateDriverAPI() {
 	assert.NotEqual(suite.T(), uuid.Nil, response.ID)
 }
 
+// createDriverValidationCases невалидные запросы на создание водителя.
+// Тела заданы готовым JSON, чтобы не сериализовать их заново при каждом запуске.
+// Ни один из них не доходит до БД, поэтому подтесты выполняются параллельно
+var createDriverValidationCases = []struct {
+	name         string
+	requestBody  json.RawMessage
+	expectedCode int
+}{
+	{
+		name:         "missing phone",
+		requestBody:  json.RawMessage(`{"email":"test@example.com","first_name":"Иван","last_name":"Тестовый"}`),
+		expectedCode: http.StatusBadRequest,
+	},
+	{
+		name:         "invalid email",
+		requestBody:  json.RawMessage(`{"phone":"+79001234567","email":"invalid-email","first_name":"Иван","last_name":"Тестовый"}`),
+		expectedCode: http.StatusBadRequest,
+	},
+	{
+		name:         "empty first_name",
+		requestBody:  json.RawMessage(`{"phone":"+79001234567","email":"test@example.com","first_name":"","last_name":"Тестовый"}`),
+		expectedCode: http.StatusBadRequest,
+	},
+}
+
 // TestCreateDriverAPIValidation тестирует валидацию при создании водителя
 func (suite *DriverAPITestSuite) TestCreateDriverAPIValidation() {
-	// Arrange - невалидные данные
-	testCases := []struct {
-		name         string
-		requestBody  map[string]interface{}
-		expectedCode int
-	}{
-		{
-			name: "missing phone",
-			requestBody: map[string]interface{}{
-				"email":      "test@example.com",
-				"first_name": "Иван",
-				"last_name":  "Тестовый",
-			},
-			expectedCode: http.StatusBadRequest,
-		},
-		{
-			name: "invalid email",
-			requestBody: map[string]interface{}{
-				"phone":      "+79001234567",
-				"email":      "invalid-email",
-				"first_name": "Иван",
-				"last_name":  "Тестовый",
-			},
-			expectedCode: http.StatusBadRequest,
-		},
-		{
-			name: "empty first_name",
-			requestBody: map[string]interface{}{
-				"phone":      "+79001234567",
-				"email":      "test@example.com",
-				"first_name": "",
-				"last_name":  "Тестовый",
-			},
-			expectedCode: http.StatusBadRequest,
-		},
-	}
-
-	for _, tc := range testCases {
+	for _, tc := range createDriverValidationCases {
+		tc := tc
 		suite.T().Run(tc.name, func(t *testing.T) {
-			// Act
-			bodyBytes, _ := json.Marshal(tc.requestBody)
-			req := httptest.NewRequest(http.MethodPost, "/api/v1/drivers", bytes.NewBuffer(bodyBytes))
-			req.Header.Set("Content-Type", "application/json")
-			w := httptest.NewRecorder()
+			t.Parallel()
 
-			suite.router.ServeHTTP(w, req)
+			// Act
+			w := suite.apiHelper.MakeRequest(helpers.APIRequest{
+				Method: http.MethodPost,
+				URL:    helpers.DriversURL,
+				Body:   tc.requestBody,
+			})
 
 			// Assert
-			assert.Equal(t, tc.expectedCode, w.Code)
+			assert.Equal(t, tc.expectedCode, w.StatusCode)
 		})
 	}
 }
@@ -186,15 +174,16 @@ func (suite *DriverAPITestSuite) TestGetDriverAPI() {
 	require.NoError(suite.T(), err)
 
 	// Act
-	req := httptest.NewRequest(http.MethodGet, fmt.Sprintf("/api/v1/drivers/%s", driver.ID), nil)
-	w := httptest.NewRecorder()
-	suite.router.ServeHTTP(w, req)
+	w := suite.apiHelper.MakeRequest(helpers.APIRequest{
+		Method: http.MethodGet,
+		URL:    helpers.NewDriverURLs(driver.ID).Driver,
+	})
 
 	// Assert
-	assert.Equal(suite.T(), http.StatusOK, w.Code)
+	assert.Equal(suite.T(), http.StatusOK, w.StatusCode)
 
 	var response httpHandlers.DriverResponse
-	err = json.Unmarshal(w.Body.Bytes(), &response)
+	err = json.Unmarshal(w.Body, &response)
 	require.NoError(suite.T(), err)
 
 	assert.Equal(suite.T(), driver.Phone, response.Phone)
@@ -204,15 +193,16 @@ func (suite *DriverAPITestSuite) TestGetDriverAPI() {
 // TestGetDriverAPINotFound тестирует получение несуществующего водителя
 func (suite *DriverAPITestSuite) TestGetDriverAPINotFound() {
 	// Act
-	req := httptest.NewRequest(http.MethodGet, fmt.Sprintf("/api/v1/drivers/%s", uuid.New()), nil)
-	w := httptest.NewRecorder()
-	suite.router.ServeHTTP(w, req)
+	w := suite.apiHelper.MakeRequest(helpers.APIRequest{
+		Method: http.MethodGet,
+		URL:    helpers.NewDriverURLs(uuid.New()).Driver,
+	})
 
 	// Assert
-	assert.Equal(suite.T(), http.StatusNotFound, w.Code)
+	assert.Equal(suite.T(), http.StatusNotFound, w.StatusCode)
 
 	var errorResponse httpHandlers.ErrorResponse
-	err := json.Unmarshal(w.Body.Bytes(), &errorResponse)
+	err := json.Unmarshal(w.Body, &errorResponse)
 	require.NoError(suite.T(), err)
 	assert.Equal(suite.T(), "DRIVER_NOT_FOUND", errorResponse.Code)
 }
@@ -220,22 +210,19 @@ func (suite *DriverAPITestSuite) TestGetDriverAPINotFound() {
 // TestListDriversAPI тестирует получение списка водителей через API
 func (suite *DriverAPITestSuite) TestListDriversAPI() {
 	// Arrange
-	drivers := fixtures.CreateMultipleTestDrivers(5)
-	for _, driver := range drivers {
-		_, err := suite.driverService.CreateDriver(suite.ctx, driver)
-		require.NoError(suite.T(), err)
-	}
+	suite.createDrivers(fixtures.CreateMultipleTestDrivers(5))
 
 	// Act
-	req := httptest.NewRequest(http.MethodGet, "/api/v1/drivers?limit=3&offset=0", nil)
-	w := httptest.NewRecorder()
-	suite.router.ServeHTTP(w, req)
+	w := suite.apiHelper.MakeRequest(helpers.APIRequest{
+		Method: http.MethodGet,
+		URL:    helpers.DriversURL + "?limit=3&offset=0",
+	})
 
 	// Assert
-	assert.Equal(suite.T(), http.StatusOK, w.Code)
+	assert.Equal(suite.T(), http.StatusOK, w.StatusCode)
 
 	var response httpHandlers.ListDriversResponse
-	err := json.Unmarshal(w.Body.Bytes(), &response)
+	err := json.Unmarshal(w.Body, &response)
 	require.NoError(suite.T(), err)
 
 	assert.Len(suite.T(), response.Drivers, 3)
@@ -258,17 +245,17 @@ func (suite *DriverAPITestSuite) TestUpdateDriverAPI() {
 	}
 
 	// Act
-	bodyBytes, _ := json.Marshal(updateData)
-	req := httptest.NewRequest(http.MethodPut, fmt.Sprintf("/api/v1/drivers/%s", createdDriver.ID), bytes.NewBuffer(bodyBytes))
-	req.Header.Set("Content-Type", "application/json")
-	w := httptest.NewRecorder()
-	suite.router.ServeHTTP(w, req)
+	w := suite.apiHelper.MakeRequest(helpers.APIRequest{
+		Method: http.MethodPut,
+		URL:    helpers.NewDriverURLs(createdDriver.ID).Driver,
+		Body:   updateData,
+	})
 
 	// Assert
-	assert.Equal(suite.T(), http.StatusOK, w.Code)
+	assert.Equal(suite.T(), http.StatusOK, w.StatusCode)
 
 	var response httpHandlers.DriverResponse
-	err = json.Unmarshal(w.Body.Bytes(), &response)
+	err = json.Unmarshal(w.Body, &response)
 	require.NoError(suite.T(), err)
 
 	assert.Equal(suite.T(), "Обновленное Имя", response.FirstName)
@@ -287,20 +274,20 @@ func (suite *DriverAPITestSuite) TestChangeDriverStatusAPI() {
 	}
 
 	// Act
-	bodyBytes, _ := json.Marshal(statusData)
-	req := httptest.NewRequest(http.MethodPatch, fmt.Sprintf("/api/v1/drivers/%s/status", createdDriver.ID), bytes.NewBuffer(bodyBytes))
-	req.Header.Set("Content-Type", "application/json")
-	w := httptest.NewRecorder()
-	suite.router.ServeHTTP(w, req)
+	w := suite.apiHelper.MakeRequest(helpers.APIRequest{
+		Method: http.MethodPatch,
+		URL:    helpers.NewDriverURLs(createdDriver.ID).Status,
+		Body:   statusData,
+	})
 
 	// Assert
-	assert.Equal(suite.T(), http.StatusOK, w.Code)
+	assert.Equal(suite.T(), http.StatusOK, w.StatusCode)
 
-	var response map[string]interface{}
-	err = json.Unmarshal(w.Body.Bytes(), &response)
+	var response httpHandlers.ChangeStatusResponse
+	err = json.Unmarshal(w.Body, &response)
 	require.NoError(suite.T(), err)
 
-	assert.Equal(suite.T(), "pending_verification", response["status"])
+	assert.Equal(suite.T(), entities.StatusPendingVerification, response.Status)
 }
 
 // TestDeleteDriverAPI тестирует удаление водителя через API
@@ -310,19 +297,23 @@ func (suite *DriverAPITestSuite) TestDeleteDriverAPI() {
 	createdDriver, err := suite.driverService.CreateDriver(suite.ctx, driver)
 	require.NoError(suite.T(), err)
 
+	driverURL := helpers.NewDriverURLs(createdDriver.ID).Driver
+
 	// Act
-	req := httptest.NewRequest(http.MethodDelete, fmt.Sprintf("/api/v1/drivers/%s", createdDriver.ID), nil)
-	w := httptest.NewRecorder()
-	suite.router.ServeHTTP(w, req)
+	w := suite.apiHelper.MakeRequest(helpers.APIRequest{
+		Method: http.MethodDelete,
+		URL:    driverURL,
+	})
 
 	// Assert
-	assert.Equal(suite.T(), http.StatusNoContent, w.Code)
+	assert.Equal(suite.T(), http.StatusNoContent, w.StatusCode)
 
 	// Проверяем, что водитель действительно удален
-	req2 := httptest.NewRequest(http.MethodGet, fmt.Sprintf("/api/v1/drivers/%s", createdDriver.ID), nil)
-	w2 := httptest.NewRecorder()
-	suite.router.ServeHTTP(w2, req2)
-	assert.Equal(suite.T(), http.StatusNotFound, w2.Code)
+	w2 := suite.apiHelper.MakeRequest(helpers.APIRequest{
+		Method: http.MethodGet,
+		URL:    driverURL,
+	})
+	assert.Equal(suite.T(), http.StatusNotFound, w2.StatusCode)
 }
 
 // TestGetActiveDriversAPI тестирует получение активных водителей через API
@@ -339,35 +330,35 @@ func (suite *DriverAPITestSuite) TestGetActiveDriversAPI() {
 		entities.StatusBlocked,
 	}
 
-	for i, driver := range drivers {
+	helpers.RunConcurrently(suite.T(), len(drivers), setupWorkers, func(i int) error {
+		driver := drivers[i]
 		driver.Status = statuses[i]
-		_, err := suite.driverService.CreateDriver(suite.ctx, driver)
-		require.NoError(suite.T(), err)
+		if _, err := suite.driverService.CreateDriver(suite.ctx, driver); err != nil {
+			return err
+		}
 
 		// Обновляем статус после создания
 		if statuses[i] != entities.StatusRegistered {
-			err = suite.driverService.ChangeDriverStatus(suite.ctx, driver.ID, statuses[i])
-			require.NoError(suite.T(), err)
+			return suite.driverService.ChangeDriverStatus(suite.ctx, driver.ID, statuses[i])
 		}
-	}
+		return nil
+	})
 
 	// Act
-	req := httptest.NewRequest(http.MethodGet, "/api/v1/drivers/active", nil)
-	w := httptest.NewRecorder()
-	suite.router.ServeHTTP(w, req)
+	w := suite.apiHelper.MakeRequest(helpers.APIRequest{
+		Method: http.MethodGet,
+		URL:    helpers.ActiveDriversURL,
+	})
 
 	// Assert
-	assert.Equal(suite.T(), http.StatusOK, w.Code)
+	assert.Equal(suite.T(), http.StatusOK, w.StatusCode)
 
-	var response map[string]interface{}
-	err := json.Unmarshal(w.Body.Bytes(), &response)
+	var response httpHandlers.ActiveDriversResponse
+	err := json.Unmarshal(w.Body, &response)
 	require.NoError(suite.T(), err)
 
-	drivers_list := response["drivers"].([]interface{})
-	count := response["count"].(float64)
-
-	assert.Equal(suite.T(), float64(3), count) // available, on_shift, busy
-	assert.Len(suite.T(), drivers_list, 3)
+	assert.Equal(suite.T(), 3, response.Count) // available, on_shift, busy
+	assert.Len(suite.T(), response.Drivers, 3)
 }
 
 // TestDriverAPIFilters тестирует фильтрацию водителей через API
@@ -380,20 +371,20 @@ func (suite *DriverAPITestSuite) TestDriverAPIFilters() {
 
 	for i, driver := range drivers {
 		driver.CurrentRating = ratings[i]
-		_, err := suite.driverService.CreateDriver(suite.ctx, driver)
-		require.NoError(suite.T(), err)
 	}
+	suite.createDrivers(drivers)
 
 	// Act - фильтр по минимальному рейтингу
-	req := httptest.NewRequest(http.MethodGet, "/api/v1/drivers?min_rating=4.0", nil)
-	w := httptest.NewRecorder()
-	suite.router.ServeHTTP(w, req)
+	w := suite.apiHelper.MakeRequest(helpers.APIRequest{
+		Method: http.MethodGet,
+		URL:    helpers.DriversURL + "?min_rating=4.0",
+	})
 
 	// Assert
-	assert.Equal(suite.T(), http.StatusOK, w.Code)
+	assert.Equal(suite.T(), http.StatusOK, w.StatusCode)
 
 	var response httpHandlers.ListDriversResponse
-	err := json.Unmarshal(w.Body.Bytes(), &response)
+	err := json.Unmarshal(w.Body, &response)
 	require.NoError(suite.T(), err)
 
 	assert.Len(suite.T(), response.Drivers, 2) // Рейтинги 4.2 и 4.8
@@ -406,30 +397,23 @@ func (suite *DriverAPITestSuite) TestDriverAPIFilters() {
 // TestDriverAPIPagination тестирует пагинацию через API
 func (suite *DriverAPITestSuite) TestDriverAPIPagination() {
 	// Arrange
-	drivers := fixtures.CreateMultipleTestDrivers(7)
-	for _, driver := range drivers {
-		_, err := suite.driverService.CreateDriver(suite.ctx, driver)
-		require.NoError(suite.T(), err)
-	}
-
-	// Act - первая страница
-	req1 := httptest.NewRequest(http.MethodGet, "/api/v1/drivers?limit=3&offset=0", nil)
-	w1 := httptest.NewRecorder()
-	suite.router.ServeHTTP(w1, req1)
+	suite.createDrivers(fixtures.CreateMultipleTestDrivers(7))
 
-	// Act - вторая страница
-	req2 := httptest.NewRequest(http.MethodGet, "/api/v1/drivers?limit=3&offset=3", nil)
-	w2 := httptest.NewRecorder()
-	suite.router.ServeHTTP(w2, req2)
+	// Act - первая и вторая страницы независимы, запрашиваем их параллельно
+	pages := suite.apiHelper.MakeRequests(
+		helpers.APIRequest{Method: http.MethodGet, URL: helpers.DriversURL + "?limit=3&offset=0"},
+		helpers.APIRequest{Method: http.MethodGet, URL: helpers.DriversURL + "?limit=3&offset=3"},
+	)
+	w1, w2 := pages[0], pages[1]
 
 	// Assert
-	assert.Equal(suite.T(), http.StatusOK, w1.Code)
-	assert.Equal(suite.T(), http.StatusOK, w2.Code)
+	assert.Equal(suite.T(), http.StatusOK, w1.StatusCode)
+	assert.Equal(suite.T(), http.StatusOK, w2.StatusCode)
 
 	var page1, page2 httpHandlers.ListDriversResponse
-	err := json.Unmarshal(w1.Body.Bytes(), &page1)
+	err := json.Unmarshal(w1.Body, &page1)
 	require.NoError(suite.T(), err)
-	err = json.Unmarshal(w2.Body.Bytes(), &page2)
+	err = json.Unmarshal(w2.Body, &page2)
 	require.NoError(suite.T(), err)
 
 	assert.Len(suite.T(), page1.Drivers, 3)
@@ -440,20 +424,28 @@ func (suite *DriverAPITestSuite) TestDriverAPIPagination() {
 	assert.True(suite.T(), page2.HasMore)
 }
 
-// TestDriverAPIInvalidID тестирует обработку невалидного ID
+// TestDriverAPIInvalidID тестирует обработку невалидного ID во всех эндпоинтах водителя
 func (suite *DriverAPITestSuite) TestDriverAPIInvalidID() {
-	// Act
-	req := httptest.NewRequest(http.MethodGet, "/api/v1/drivers/invalid-uuid", nil)
-	w := httptest.NewRecorder()
-	suite.router.ServeHTTP(w, req)
+	// Arrange
+	invalidURL := helpers.DriversURL + "/invalid-uuid"
+
+	// Act - запросы независимы и отправляются одновременно
+	responses := suite.apiHelper.MakeRequests(
+		helpers.APIRequest{Method: http.MethodGet, URL: invalidURL},
+		helpers.APIRequest{Method: http.MethodPut, URL: invalidURL, Body: map[string]interface{}{"first_name": "Петр"}},
+		helpers.APIRequest{Method: http.MethodDelete, URL: invalidURL},
+		helpers.APIRequest{Method: http.MethodPatch, URL: invalidURL + "/status", Body: map[string]string{"status": "available"}},
+	)
 
 	// Assert
-	assert.Equal(suite.T(), http.StatusBadRequest, w.Code)
+	for _, w := range responses {
+		assert.Equal(suite.T(), http.StatusBadRequest, w.StatusCode)
 
-	var errorResponse httpHandlers.ErrorResponse
-	err := json.Unmarshal(w.Body.Bytes(), &errorResponse)
-	require.NoError(suite.T(), err)
-	assert.Contains(suite.T(), errorResponse.Error, "Invalid driver ID format")
+		var errorResponse httpHandlers.ErrorResponse
+		err := json.Unmarshal(w.Body, &errorResponse)
+		require.NoError(suite.T(), err)
+		assert.Contains(suite.T(), errorResponse.Error, "Invalid driver ID format")
+	}
 }
 
 // TestDriverAPIDuplicateCreation тестирует создание дублирующего водителя
@@ -477,17 +469,17 @@ func (suite *DriverAPITestSuite) TestDriverAPIDuplicateCreation() {
 	}
 
 	// Act
-	bodyBytes, _ := json.Marshal(requestBody)
-	req := httptest.NewRequest(http.MethodPost, "/api/v1/drivers", bytes.NewBuffer(bodyBytes))
-	req.Header.Set("Content-Type", "application/json")
-	w := httptest.NewRecorder()
-	suite.router.ServeHTTP(w, req)
+	w := suite.apiHelper.MakeRequest(helpers.APIRequest{
+		Method: http.MethodPost,
+		URL:    helpers.DriversURL,
+		Body:   requestBody,
+	})
 
 	// Assert
-	assert.Equal(suite.T(), http.StatusConflict, w.Code)
+	assert.Equal(suite.T(), http.StatusConflict, w.StatusCode)
 
 	var errorResponse httpHandlers.ErrorResponse
-	err = json.Unmarshal(w.Body.Bytes(), &errorResponse)
+	err = json.Unmarshal(w.Body, &errorResponse)
 	require.NoError(suite.T(), err)
 	assert.Equal(suite.T(), "DRIVER_EXISTS", errorResponse.Code)
 }
@@ -495,15 +487,16 @@ func (suite *DriverAPITestSuite) TestDriverAPIDuplicateCreation() {
 // TestHealthCheckAPI тестирует health check endpoint
 func (suite *DriverAPITestSuite) TestHealthCheckAPI() {
 	// Act
-	req := httptest.NewRequest(http.MethodGet, "/health", nil)
-	w := httptest.NewRecorder()
-	suite.router.ServeHTTP(w, req)
+	w := suite.apiHelper.MakeRequest(helpers.APIRequest{
+		Method: http.MethodGet,
+		URL:    helpers.HealthURL,
+	})
 
 	// Assert
-	assert.Equal(suite.T(), http.StatusOK, w.Code)
+	assert.Equal(suite.T(), http.StatusOK, w.StatusCode)
 
 	var response map[string]interface{}
-	err := json.Unmarshal(w.Body.Bytes(), &response)
+	err := json.Unmarshal(w.Body, &response)
 	require.NoError(suite.T(), err)
 
 	assert.Equal(suite.T(), "healthy", response["status"])
@@ -514,39 +507,55 @@ func (suite *DriverAPITestSuite) TestHealthCheckAPI() {
 // TestCORSHeaders тестирует CORS заголовки
 func (suite *DriverAPITestSuite) TestCORSHeaders() {
 	// Act - OPTIONS запрос
-	req := httptest.NewRequest(http.MethodOptions, "/api/v1/drivers", nil)
-	req.Header.Set("Origin", "http://localhost:3000")
-	w := httptest.NewRecorder()
-	suite.router.ServeHTTP(w, req)
+	w := suite.apiHelper.MakeRequest(helpers.APIRequest{
+		Method:  http.MethodOptions,
+		URL:     helpers.DriversURL,
+		Headers: map[string]string{"Origin": "http://localhost:3000"},
+	})
 
 	// Assert
-	assert.Equal(suite.T(), http.StatusNoContent, w.Code)
-	assert.Equal(suite.T(), "http://localhost:3000", w.Header().Get("Access-Control-Allow-Origin"))
-	assert.Contains(suite.T(), w.Header().Get("Access-Control-Allow-Methods"), "POST")
-	assert.Contains(suite.T(), w.Header().Get("Access-Control-Allow-Headers"), "Content-Type")
+	assert.Equal(suite.T(), http.StatusNoContent, w.StatusCode)
+	assert.Equal(suite.T(), "http://localhost:3000", w.Headers.Get("Access-Control-Allow-Origin"))
+	assert.Contains(suite.T(), w.Headers.Get("Access-Control-Allow-Methods"), "POST")
+	assert.Contains(suite.T(), w.Headers.Get("Access-Control-Allow-Headers"), "Content-Type")
 }
 
 // TestRequestIDMiddleware тестирует middleware для Request ID
 func (suite *DriverAPITestSuite) TestRequestIDMiddleware() {
-	// Act - без X-Request-ID заголовка
-	req1 := httptest.NewRequest(http.MethodGet, "/health", nil)
-	w1 := httptest.NewRecorder()
-	suite.router.ServeHTTP(w1, req1)
-
-	// Act - с X-Request-ID заголовком
+	// Act - запросы без X-Request-ID и с ним независимы и выполняются параллельно
 	customRequestID := uuid.New().String()
-	req2 := httptest.NewRequest(http.MethodGet, "/health", nil)
-	req2.Header.Set("X-Request-ID", customRequestID)
-	w2 := httptest.NewRecorder()
-	suite.router.ServeHTTP(w2, req2)
+	responses := suite.apiHelper.MakeRequests(
+		helpers.APIRequest{
+			Method: http.MethodGet,
+			URL:    helpers.HealthURL,
+		},
+		helpers.APIRequest{
+			Method:  http.MethodGet,
+			URL:     helpers.HealthURL,
+			Headers: map[string]string{"X-Request-ID": customRequestID},
+		},
+	)
+	w1, w2 := responses[0], responses[1]
 
 	// Assert
-	assert.Equal(suite.T(), http.StatusOK, w1.Code)
-	assert.Equal(suite.T(), http.StatusOK, w2.Code)
+	assert.Equal(suite.T(), http.StatusOK, w1.StatusCode)
+	assert.Equal(suite.T(), http.StatusOK, w2.StatusCode)
 
 	// Проверяем, что Request ID установлен
-	assert.NotEmpty(suite.T(), w1.Header().Get("X-Request-ID"))
-	assert.Equal(suite.T(), customRequestID, w2.Header().Get("X-Request-ID"))
+	assert.NotEmpty(suite.T(), w1.Headers.Get("X-Request-ID"))
+	assert.Equal(suite.T(), customRequestID, w2.Headers.Get("X-Request-ID"))
+}
+
+// setupWorkers число параллельных запросов при подготовке данных
+const setupWorkers = 8
+
+// createDrivers создает водителей параллельно: каждое создание - отдельный
+// round-trip в БД, и последовательная подготовка занимает большую часть теста
+func (suite *DriverAPITestSuite) createDrivers(drivers []*entities.Driver) {
+	helpers.RunConcurrently(suite.T(), len(drivers), setupWorkers, func(i int) error {
+		_, err := suite.driverService.CreateDriver(suite.ctx, drivers[i])
+		return err
+	})
 }
 
 // mockEventPublisher заглушка для EventPublisher в тестах
@@ -561,5 +570,6 @@ func (m *mockEventPublisher) PublishDriverEvent(ctx context.Context, eventType s
 
 // Запуск тестового suite
 func TestDriverAPITestSuite(t *testing.T) {
+	t.Parallel()
 	suite.Run(t, new(DriverAPITestSuite))
 }
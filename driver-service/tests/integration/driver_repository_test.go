@@ -487,5 +487,6 @@ func (suite *DriverRepositoryTestSuite) TestDriverFiltersDateRange() {
 
 // Запуск тестового suite
 func TestDriverRepositoryTestSuite(t *testing.T) {
+	t.Parallel()
 	suite.Run(t, new(DriverRepositoryTestSuite))
 }
@@ -4,6 +4,7 @@ package integration
 
 import (
 	"context"
+	"encoding/json"
 	"fmt"
 	"net/http"
 	"testing"
@@ -32,6 +33,7 @@ type E2ETestSuite struct {
 	server          *httpServer.Server
 	router          *gin.Engine
 	apiHelper       *helpers.APITestHelper
+	documentRepo    repositories.DocumentRepository
 	driverService   services.DriverService
 	locationService services.LocationService
 	ctx             context.Context
@@ -39,22 +41,20 @@ type E2ETestSuite struct {
 
 // SetupSuite выполняется один раз перед всеми тестами
 func (suite *E2ETestSuite) SetupSuite() {
-	gin.SetMode(gin.TestMode)
-
 	suite.testDB = helpers.SetupTestDB(suite.T())
 	logger := helpers.CreateTestLogger(suite.T())
 	suite.ctx = context.Background()
 
 	// Инициализируем репозитории
 	driverRepo := repositories.NewDriverRepository(suite.testDB.DB, logger)
-	documentRepo := repositories.NewDocumentRepository(suite.testDB.DB, logger)
+	suite.documentRepo = repositories.NewDocumentRepository(suite.testDB.DB, logger)
 	locationRepo := repositories.NewLocationRepository(suite.testDB.DB, logger)
 
 	// Создаем mock EventPublisher
 	eventBus := &mockEventPublisher{logger: logger}
 
 	// Инициализируем сервисы
-	suite.driverService = services.NewDriverService(driverRepo, documentRepo, eventBus, logger)
+	suite.driverService = services.NewDriverService(driverRepo, suite.documentRepo, eventBus, logger)
 	suite.locationService = services.NewLocationService(locationRepo, driverRepo, eventBus, logger)
 
 	// Создаем handlers
@@ -94,7 +94,7 @@ func (suite *E2ETestSuite) TestCompleteDriverWorkflow() {
 	driverData := helpers.CreateDriverRequest()
 	response := suite.apiHelper.MakeRequest(helpers.APIRequest{
 		Method: http.MethodPost,
-		URL:    "/api/v1/drivers",
+		URL:    helpers.DriversURL,
 		Body:   driverData,
 	})
 
@@ -107,13 +107,14 @@ func (suite *E2ETestSuite) TestCompleteDriverWorkflow() {
 	assert.Equal(suite.T(), driverData["phone"], createdDriver.Phone)
 
 	driverID := createdDriver.ID
+	driverURLs := helpers.NewDriverURLs(driverID)
 
 	// 2. Обновление статуса на pending_verification
 	suite.T().Log("Step 2: Status change to pending verification")
 
 	statusResponse := suite.apiHelper.MakeRequest(helpers.APIRequest{
 		Method: http.MethodPatch,
-		URL:    fmt.Sprintf("/api/v1/drivers/%s/status", driverID),
+		URL:    driverURLs.Status,
 		Body:   map[string]string{"status": "pending_verification"},
 	})
 
@@ -124,7 +125,7 @@ func (suite *E2ETestSuite) TestCompleteDriverWorkflow() {
 
 	// Здесь в реальном приложении были бы API вызовы для загрузки документов
 	// Пока используем прямое обращение к репозиторию
-	documentRepo := repositories.NewDocumentRepository(suite.testDB.DB, helpers.CreateTestLogger(suite.T()))
+	documentRepo := suite.documentRepo
 
 	licenseDoc := entities.NewDriverDocument(
 		driverID,
@@ -147,7 +148,7 @@ func (suite *E2ETestSuite) TestCompleteDriverWorkflow() {
 
 	statusResponse = suite.apiHelper.MakeRequest(helpers.APIRequest{
 		Method: http.MethodPatch,
-		URL:    fmt.Sprintf("/api/v1/drivers/%s/status", driverID),
+		URL:    driverURLs.Status,
 		Body:   map[string]string{"status": "verified"},
 	})
 
@@ -158,7 +159,7 @@ func (suite *E2ETestSuite) TestCompleteDriverWorkflow() {
 
 	statusResponse = suite.apiHelper.MakeRequest(helpers.APIRequest{
 		Method: http.MethodPatch,
-		URL:    fmt.Sprintf("/api/v1/drivers/%s/status", driverID),
+		URL:    driverURLs.Status,
 		Body:   map[string]string{"status": "available"},
 	})
 
@@ -169,16 +170,15 @@ func (suite *E2ETestSuite) TestCompleteDriverWorkflow() {
 
 	activeResponse := suite.apiHelper.MakeRequest(helpers.APIRequest{
 		Method: http.MethodGet,
-		URL:    "/api/v1/drivers/active",
+		URL:    helpers.ActiveDriversURL,
 	})
 
 	suite.apiHelper.AssertStatusCode(activeResponse, http.StatusOK)
 
-	var activeDriversResp map[string]interface{}
+	var activeDriversResp httpHandlers.ActiveDriversResponse
 	suite.apiHelper.UnmarshalResponse(activeResponse, &activeDriversResp)
 
-	drivers := activeDriversResp["drivers"].([]interface{})
-	assert.Len(suite.T(), drivers, 1)
+	assert.Len(suite.T(), activeDriversResp.Drivers, 1)
 
 	// 7. Обновление местоположения
 	suite.T().Log("Step 7: Update driver location")
@@ -186,7 +186,7 @@ func (suite *E2ETestSuite) TestCompleteDriverWorkflow() {
 	locationData := helpers.CreateLocationRequest()
 	locationResponse := suite.apiHelper.MakeRequest(helpers.APIRequest{
 		Method: http.MethodPost,
-		URL:    fmt.Sprintf("/api/v1/drivers/%s/locations", driverID),
+		URL:    driverURLs.Locations,
 		Body:   locationData,
 	})
 
@@ -197,7 +197,7 @@ func (suite *E2ETestSuite) TestCompleteDriverWorkflow() {
 
 	currentLocationResponse := suite.apiHelper.MakeRequest(helpers.APIRequest{
 		Method: http.MethodGet,
-		URL:    fmt.Sprintf("/api/v1/drivers/%s/locations/current", driverID),
+		URL:    driverURLs.CurrentLocation,
 	})
 
 	suite.apiHelper.AssertStatusCode(currentLocationResponse, http.StatusOK)
@@ -213,7 +213,7 @@ func (suite *E2ETestSuite) TestCompleteDriverWorkflow() {
 
 	nearbyResponse := suite.apiHelper.MakeRequest(helpers.APIRequest{
 		Method: http.MethodGet,
-		URL:    "/api/v1/locations/nearby",
+		URL:    helpers.NearbyDriversURL,
 		QueryParams: map[string]string{
 			"latitude":  fmt.Sprintf("%f", locationData["latitude"]),
 			"longitude": fmt.Sprintf("%f", locationData["longitude"]),
@@ -239,7 +239,7 @@ func (suite *E2ETestSuite) TestCompleteDriverWorkflow() {
 
 	updateResponse := suite.apiHelper.MakeRequest(helpers.APIRequest{
 		Method: http.MethodPut,
-		URL:    fmt.Sprintf("/api/v1/drivers/%s", driverID),
+		URL:    driverURLs.Driver,
 		Body:   updateData,
 	})
 
@@ -260,7 +260,7 @@ func (suite *E2ETestSuite) TestDriverLocationTracking() {
 	driverData := helpers.CreateDriverRequest()
 	response := suite.apiHelper.MakeRequest(helpers.APIRequest{
 		Method: http.MethodPost,
-		URL:    "/api/v1/drivers",
+		URL:    helpers.DriversURL,
 		Body:   driverData,
 	})
 
@@ -268,6 +268,7 @@ func (suite *E2ETestSuite) TestDriverLocationTracking() {
 
 	var driver httpHandlers.DriverResponse
 	suite.apiHelper.UnmarshalResponse(response, &driver)
+	driverURLs := helpers.NewDriverURLs(driver.ID)
 
 	// 2. Отправляем серию обновлений местоположения (имитация поездки)
 	suite.T().Log("Simulating trip with location updates")
@@ -282,35 +283,43 @@ func (suite *E2ETestSuite) TestDriverLocationTracking() {
 		{"latitude": 55.7655, "longitude": 37.6220, "speed": 0.0},  // Остановка
 	}
 
+	// Точки получают явные возрастающие timestamp с шагом в секунду, поэтому
+	// порядок в истории не зависит от пауз между запросами
+	baseTimestamp := time.Now().Add(-time.Duration(len(route)) * time.Second).Unix()
 	for i, point := range route {
+		point["timestamp"] = baseTimestamp + int64(i)
+
 		locationResponse := suite.apiHelper.MakeRequest(helpers.APIRequest{
 			Method: http.MethodPost,
-			URL:    fmt.Sprintf("/api/v1/drivers/%s/locations", driver.ID),
+			URL:    driverURLs.Locations,
 			Body:   point,
 		})
 
 		suite.apiHelper.AssertStatusCode(locationResponse, http.StatusOK)
-
-		// Небольшая пауза между обновлениями
-		if i < len(route)-1 {
-			time.Sleep(100 * time.Millisecond)
-		}
 	}
 
-	// 3. Получаем историю местоположений
-	suite.T().Log("Getting location history")
-
-	from := time.Now().Add(-1 * time.Hour).Unix()
-	to := time.Now().Unix()
-
-	historyResponse := suite.apiHelper.MakeRequest(helpers.APIRequest{
-		Method: http.MethodGet,
-		URL:    fmt.Sprintf("/api/v1/drivers/%s/locations/history", driver.ID),
-		QueryParams: map[string]string{
-			"from": fmt.Sprintf("%d", from),
-			"to":   fmt.Sprintf("%d", to),
+	// 3. Получаем историю и текущее местоположение. Оба запроса только читают
+	// записанный маршрут, поэтому выполняются параллельно
+	suite.T().Log("Getting location history and current location")
+
+	to := time.Now()
+	from := to.Add(-1 * time.Hour)
+
+	responses := suite.apiHelper.MakeRequests(
+		helpers.APIRequest{
+			Method: http.MethodGet,
+			URL:    driverURLs.LocationHistory,
+			QueryParams: map[string]string{
+				"from": fmt.Sprintf("%d", from.Unix()),
+				"to":   fmt.Sprintf("%d", to.Unix()),
+			},
 		},
-	})
+		helpers.APIRequest{
+			Method: http.MethodGet,
+			URL:    driverURLs.CurrentLocation,
+		},
+	)
+	historyResponse, currentResponse := responses[0], responses[1]
 
 	suite.apiHelper.AssertStatusCode(historyResponse, http.StatusOK)
 
@@ -323,13 +332,6 @@ func (suite *E2ETestSuite) TestDriverLocationTracking() {
 	assert.Equal(suite.T(), 40.0, history.Stats.MaxSpeed)
 
 	// 4. Проверяем текущее местоположение
-	suite.T().Log("Checking current location")
-
-	currentResponse := suite.apiHelper.MakeRequest(helpers.APIRequest{
-		Method: http.MethodGet,
-		URL:    fmt.Sprintf("/api/v1/drivers/%s/locations/current", driver.ID),
-	})
-
 	suite.apiHelper.AssertStatusCode(currentResponse, http.StatusOK)
 
 	var currentLocation httpHandlers.LocationResponse
@@ -346,20 +348,25 @@ func (suite *E2ETestSuite) TestMultipleDriversScenario() {
 	// 1. Создаем несколько водителей
 	suite.T().Log("Creating multiple drivers")
 
-	var driverIDs []uuid.UUID
-
-	for i := 0; i < 5; i++ {
+	// Водители независимы друг от друга, поэтому запросы на создание
+	// отправляются одновременно
+	const driversCount = 5
+	createRequests := make([]helpers.APIRequest, driversCount)
+	for i := range createRequests {
 		driverData := helpers.CreateDriverRequest()
 		driverData["phone"] = fmt.Sprintf("+7900123456%d", i)
 		driverData["email"] = fmt.Sprintf("driver%d@example.com", i)
 		driverData["license_number"] = fmt.Sprintf("TEST12345%d", i)
 
-		response := suite.apiHelper.MakeRequest(helpers.APIRequest{
+		createRequests[i] = helpers.APIRequest{
 			Method: http.MethodPost,
-			URL:    "/api/v1/drivers",
+			URL:    helpers.DriversURL,
 			Body:   driverData,
-		})
+		}
+	}
 
+	driverIDs := make([]uuid.UUID, 0, driversCount)
+	for _, response := range suite.apiHelper.MakeRequests(createRequests...) {
 		suite.apiHelper.AssertStatusCode(response, http.StatusCreated)
 
 		var driver httpHandlers.DriverResponse
@@ -370,30 +377,26 @@ func (suite *E2ETestSuite) TestMultipleDriversScenario() {
 	// 2. Переводим водителей в available статус
 	suite.T().Log("Changing drivers status to available")
 
-	for _, driverID := range driverIDs {
-		// Сначала pending_verification
-		statusResponse := suite.apiHelper.MakeRequest(helpers.APIRequest{
-			Method: http.MethodPatch,
-			URL:    fmt.Sprintf("/api/v1/drivers/%s/status", driverID),
-			Body:   map[string]string{"status": "pending_verification"},
-		})
-		suite.apiHelper.AssertStatusCode(statusResponse, http.StatusOK)
-
-		// Затем verified
-		statusResponse = suite.apiHelper.MakeRequest(helpers.APIRequest{
-			Method: http.MethodPatch,
-			URL:    fmt.Sprintf("/api/v1/drivers/%s/status", driverID),
-			Body:   map[string]string{"status": "verified"},
-		})
-		suite.apiHelper.AssertStatusCode(statusResponse, http.StatusOK)
+	// Переходы одного водителя последовательны, но водители независимы друг от друга,
+	// поэтому каждый шаг (pending_verification -> verified -> available) отправляется
+	// всем водителям одновременно
+	for _, status := range []string{"pending_verification", "verified", "available"} {
+		// Тело запроса одинаково для всех водителей и сериализуется один раз на шаг
+		statusBody, err := json.Marshal(httpHandlers.ChangeStatusRequest{Status: status})
+		require.NoError(suite.T(), err)
+
+		statusRequests := make([]helpers.APIRequest, len(driverIDs))
+		for i, driverID := range driverIDs {
+			statusRequests[i] = helpers.APIRequest{
+				Method: http.MethodPatch,
+				URL:    helpers.NewDriverURLs(driverID).Status,
+				Body:   statusBody,
+			}
+		}
 
-		// Наконец available
-		statusResponse = suite.apiHelper.MakeRequest(helpers.APIRequest{
-			Method: http.MethodPatch,
-			URL:    fmt.Sprintf("/api/v1/drivers/%s/status", driverID),
-			Body:   map[string]string{"status": "available"},
-		})
-		suite.apiHelper.AssertStatusCode(statusResponse, http.StatusOK)
+		for _, statusResponse := range suite.apiHelper.MakeRequests(statusRequests...) {
+			suite.apiHelper.AssertStatusCode(statusResponse, http.StatusOK)
+		}
 	}
 
 	// 3. Добавляем местоположения для всех водителей
@@ -402,52 +405,56 @@ func (suite *E2ETestSuite) TestMultipleDriversScenario() {
 	centerLat := 55.7558
 	centerLon := 37.6173
 
+	// Обновления разных водителей независимы и отправляются одновременно
+	locationRequests := make([]helpers.APIRequest, len(driverIDs))
+	speeds := make([]float64, len(driverIDs))
 	for i, driverID := range driverIDs {
-		locationData := map[string]interface{}{
-			"latitude":  centerLat + float64(i)*0.01, // Распределяем водителей
-			"longitude": centerLon + float64(i)*0.01,
-			"speed":     float64(30 + i*5),
-		}
-
-		locationResponse := suite.apiHelper.MakeRequest(helpers.APIRequest{
+		speeds[i] = float64(30 + i*5)
+		locationRequests[i] = helpers.APIRequest{
 			Method: http.MethodPost,
-			URL:    fmt.Sprintf("/api/v1/drivers/%s/locations", driverID),
-			Body:   locationData,
-		})
+			URL:    helpers.NewDriverURLs(driverID).Locations,
+			Body: &httpHandlers.UpdateLocationRequest{
+				Latitude:  centerLat + float64(i)*0.01, // Распределяем водителей
+				Longitude: centerLon + float64(i)*0.01,
+				Speed:     &speeds[i],
+			},
+		}
+	}
 
+	for _, locationResponse := range suite.apiHelper.MakeRequests(locationRequests...) {
 		suite.apiHelper.AssertStatusCode(locationResponse, http.StatusOK)
 	}
 
-	// 4. Проверяем список активных водителей
-	suite.T().Log("Checking active drivers list")
+	// 4. Запрашиваем список активных водителей и поиск поблизости параллельно:
+	// оба запроса только читают состояние, подготовленное выше
+	suite.T().Log("Checking active drivers list and nearby drivers search")
 
-	activeResponse := suite.apiHelper.MakeRequest(helpers.APIRequest{
-		Method: http.MethodGet,
-		URL:    "/api/v1/drivers/active",
-	})
+	responses := suite.apiHelper.MakeRequests(
+		helpers.APIRequest{
+			Method: http.MethodGet,
+			URL:    helpers.ActiveDriversURL,
+		},
+		helpers.APIRequest{
+			Method: http.MethodGet,
+			URL:    helpers.NearbyDriversURL,
+			QueryParams: map[string]string{
+				"latitude":  fmt.Sprintf("%f", centerLat),
+				"longitude": fmt.Sprintf("%f", centerLon),
+				"radius_km": "5",
+				"limit":     "10",
+			},
+		},
+	)
+	activeResponse, nearbyResponse := responses[0], responses[1]
 
 	suite.apiHelper.AssertStatusCode(activeResponse, http.StatusOK)
 
-	var activeDriversResp map[string]interface{}
+	var activeDriversResp httpHandlers.ActiveDriversResponse
 	suite.apiHelper.UnmarshalResponse(activeResponse, &activeDriversResp)
 
-	drivers := activeDriversResp["drivers"].([]interface{})
-	assert.Len(suite.T(), drivers, 5)
-
-	// 5. Тестируем поиск водителей поблизости
-	suite.T().Log("Testing nearby drivers search")
-
-	nearbyResponse := suite.apiHelper.MakeRequest(helpers.APIRequest{
-		Method: http.MethodGet,
-		URL:    "/api/v1/locations/nearby",
-		QueryParams: map[string]string{
-			"latitude":  fmt.Sprintf("%f", centerLat),
-			"longitude": fmt.Sprintf("%f", centerLon),
-			"radius_km": "5",
-			"limit":     "10",
-		},
-	})
+	assert.Len(suite.T(), activeDriversResp.Drivers, 5)
 
+	// 5. Проверяем поиск водителей поблизости
 	suite.apiHelper.AssertStatusCode(nearbyResponse, http.StatusOK)
 
 	var nearbyDrivers httpHandlers.NearbyDriversResponse
@@ -459,16 +466,28 @@ func (suite *E2ETestSuite) TestMultipleDriversScenario() {
 	// 6. Тестируем пагинацию списка водителей
 	suite.T().Log("Testing drivers list pagination")
 
-	// Первая страница
-	page1Response := suite.apiHelper.MakeRequest(helpers.APIRequest{
-		Method: http.MethodGet,
-		URL:    "/api/v1/drivers",
-		QueryParams: map[string]string{
-			"limit":  "3",
-			"offset": "0",
+	// Первая и вторая страницы запрашиваются параллельно
+	pageResponses := suite.apiHelper.MakeRequests(
+		helpers.APIRequest{
+			Method: http.MethodGet,
+			URL:    helpers.DriversURL,
+			QueryParams: map[string]string{
+				"limit":  "3",
+				"offset": "0",
+			},
 		},
-	})
+		helpers.APIRequest{
+			Method: http.MethodGet,
+			URL:    helpers.DriversURL,
+			QueryParams: map[string]string{
+				"limit":  "3",
+				"offset": "3",
+			},
+		},
+	)
+	page1Response, page2Response := pageResponses[0], pageResponses[1]
 
+	// Первая страница
 	suite.apiHelper.AssertStatusCode(page1Response, http.StatusOK)
 
 	var page1 httpHandlers.ListDriversResponse
@@ -479,15 +498,6 @@ func (suite *E2ETestSuite) TestMultipleDriversScenario() {
 	assert.True(suite.T(), page1.HasMore)
 
 	// Вторая страница
-	page2Response := suite.apiHelper.MakeRequest(helpers.APIRequest{
-		Method: http.MethodGet,
-		URL:    "/api/v1/drivers",
-		QueryParams: map[string]string{
-			"limit":  "3",
-			"offset": "3",
-		},
-	})
-
 	suite.apiHelper.AssertStatusCode(page2Response, http.StatusOK)
 
 	var page2 httpHandlers.ListDriversResponse
@@ -511,7 +521,7 @@ func (suite *E2ETestSuite) TestErrorHandlingScenarios() {
 
 	response := suite.apiHelper.MakeRequest(helpers.APIRequest{
 		Method: http.MethodPost,
-		URL:    "/api/v1/drivers",
+		URL:    helpers.DriversURL,
 		Body:   invalidDriverData,
 	})
 
@@ -523,7 +533,7 @@ func (suite *E2ETestSuite) TestErrorHandlingScenarios() {
 	nonExistentID := uuid.New()
 	response = suite.apiHelper.MakeRequest(helpers.APIRequest{
 		Method: http.MethodGet,
-		URL:    fmt.Sprintf("/api/v1/drivers/%s", nonExistentID),
+		URL:    helpers.NewDriverURLs(nonExistentID).Driver,
 	})
 
 	suite.apiHelper.AssertStatusCode(response, http.StatusNotFound)
@@ -536,12 +546,13 @@ func (suite *E2ETestSuite) TestErrorHandlingScenarios() {
 	validDriverData := helpers.CreateDriverRequest()
 	driverResponse := suite.apiHelper.MakeRequest(helpers.APIRequest{
 		Method: http.MethodPost,
-		URL:    "/api/v1/drivers",
+		URL:    helpers.DriversURL,
 		Body:   validDriverData,
 	})
 
 	var driver httpHandlers.DriverResponse
 	suite.apiHelper.UnmarshalResponse(driverResponse, &driver)
+	driverURLs := helpers.NewDriverURLs(driver.ID)
 
 	// Отправляем невалидные координаты
 	invalidLocationData := map[string]interface{}{
@@ -551,7 +562,7 @@ func (suite *E2ETestSuite) TestErrorHandlingScenarios() {
 
 	locationResponse := suite.apiHelper.MakeRequest(helpers.APIRequest{
 		Method: http.MethodPost,
-		URL:    fmt.Sprintf("/api/v1/drivers/%s/locations", driver.ID),
+		URL:    driverURLs.Locations,
 		Body:   invalidLocationData,
 	})
 
@@ -563,7 +574,7 @@ func (suite *E2ETestSuite) TestErrorHandlingScenarios() {
 	// Пытаемся перейти напрямую от registered к available (недопустимо)
 	statusResponse := suite.apiHelper.MakeRequest(helpers.APIRequest{
 		Method: http.MethodPatch,
-		URL:    fmt.Sprintf("/api/v1/drivers/%s/status", driver.ID),
+		URL:    driverURLs.Status,
 		Body:   map[string]string{"status": "available"},
 	})
 
@@ -576,6 +587,7 @@ func (suite *E2ETestSuite) TestConcurrentAPIRequests() {
 	driver := fixtures.CreateTestDriver()
 	createdDriver, err := suite.driverService.CreateDriver(suite.ctx, driver)
 	require.NoError(suite.T(), err)
+	driverURLs := helpers.NewDriverURLs(createdDriver.ID)
 
 	// Act - одновременные запросы разных типов
 	const concurrency = 20
@@ -590,7 +602,7 @@ func (suite *E2ETestSuite) TestConcurrentAPIRequests() {
 				// GET запрос
 				response := suite.apiHelper.MakeRequest(helpers.APIRequest{
 					Method: http.MethodGet,
-					URL:    fmt.Sprintf("/api/v1/drivers/%s", createdDriver.ID),
+					URL:    driverURLs.Driver,
 				})
 				if response.StatusCode != http.StatusOK {
 					err = fmt.Errorf("GET request failed with status %d", response.StatusCode)
@@ -598,13 +610,13 @@ func (suite *E2ETestSuite) TestConcurrentAPIRequests() {
 
 			case 1:
 				// Обновление местоположения
-				locationData := map[string]interface{}{
-					"latitude":  55.7558 + float64(requestID)*0.0001,
-					"longitude": 37.6173 + float64(requestID)*0.0001,
+				locationData := &httpHandlers.UpdateLocationRequest{
+					Latitude:  55.7558 + float64(requestID)*0.0001,
+					Longitude: 37.6173 + float64(requestID)*0.0001,
 				}
 				response := suite.apiHelper.MakeRequest(helpers.APIRequest{
 					Method: http.MethodPost,
-					URL:    fmt.Sprintf("/api/v1/drivers/%s/locations", createdDriver.ID),
+					URL:    driverURLs.Locations,
 					Body:   locationData,
 				})
 				if response.StatusCode != http.StatusOK {
@@ -615,7 +627,7 @@ func (suite *E2ETestSuite) TestConcurrentAPIRequests() {
 				// Получение текущего местоположения
 				response := suite.apiHelper.MakeRequest(helpers.APIRequest{
 					Method: http.MethodGet,
-					URL:    fmt.Sprintf("/api/v1/drivers/%s/locations/current", createdDriver.ID),
+					URL:    driverURLs.CurrentLocation,
 				})
 				if response.StatusCode != http.StatusOK && response.StatusCode != http.StatusNotFound {
 					err = fmt.Errorf("Get current location failed with status %d", response.StatusCode)
@@ -625,7 +637,7 @@ func (suite *E2ETestSuite) TestConcurrentAPIRequests() {
 				// Список водителей
 				response := suite.apiHelper.MakeRequest(helpers.APIRequest{
 					Method:      http.MethodGet,
-					URL:         "/api/v1/drivers",
+					URL:         helpers.DriversURL,
 					QueryParams: map[string]string{"limit": "10"},
 				})
 				if response.StatusCode != http.StatusOK {
@@ -658,5 +670,6 @@ func stringPtr(s string) *string {
 
 // Запуск тестового suite
 func TestE2ETestSuite(t *testing.T) {
+	t.Parallel()
 	suite.Run(t, new(E2ETestSuite))
 }
@@ -3,12 +3,11 @@
 package integration
 
 import (
-	"bytes"
 	"context"
 	"encoding/json"
 	"fmt"
 	"net/http"
-	"net/http/httptest"
+	"strconv"
 	"testing"
 	"time"
 
@@ -28,6 +27,11 @@ import (
 	"github.com/stretchr/testify/suite"
 )
 
+// validLocationBody валидное тело запроса на обновление местоположения для тестов,
+// которым важен не сам payload, а реакция API; сериализуется один раз и
+// передается в APITestHelper без повторного json.Marshal
+var validLocationBody = json.RawMessage(`{"latitude":55.7558,"longitude":37.6173}`)
+
 // LocationAPITestSuite тестовый suite для Location HTTP API
 type LocationAPITestSuite struct {
 	suite.Suite
@@ -38,12 +42,12 @@ type LocationAPITestSuite struct {
 	locationService services.LocationService
 	ctx             context.Context
 	testDriverID    uuid.UUID
+	driverURLs      helpers.DriverURLs
+	apiHelper       *helpers.APITestHelper
 }
 
 // SetupSuite выполняется один раз перед всеми тестами
 func (suite *LocationAPITestSuite) SetupSuite() {
-	gin.SetMode(gin.TestMode)
-
 	suite.testDB = helpers.SetupTestDB(suite.T())
 	logger := helpers.CreateTestLogger(suite.T())
 	suite.ctx = context.Background()
@@ -76,6 +80,15 @@ func (suite *LocationAPITestSuite) SetupSuite() {
 	// Создаем HTTP сервер
 	suite.server = httpServer.NewServer(cfg, logger, driverHandler, locationHandler)
 	suite.router = suite.server.GetRouter()
+	suite.apiHelper = helpers.NewAPITestHelper(suite.router, suite.T())
+
+	// Создаем тестового водителя один раз: тесты suite только читают его данные
+	suite.testDB.CleanupTables(suite.T())
+	driver := fixtures.CreateTestDriver()
+	createdDriver, err := suite.driverService.CreateDriver(suite.ctx, driver)
+	require.NoError(suite.T(), err)
+	suite.testDriverID = createdDriver.ID
+	suite.driverURLs = helpers.NewDriverURLs(suite.testDriverID)
 }
 
 // TearDownSuite выполняется один раз после всех тестов
@@ -85,13 +98,7 @@ func (suite *LocationAPITestSuite) TearDownSuite() {
 
 // SetupTest выполняется перед каждым тестом
 func (suite *LocationAPITestSuite) SetupTest() {
-	suite.testDB.CleanupTables(suite.T())
-
-	// Создаем тестового водителя
-	driver := fixtures.CreateTestDriver()
-	createdDriver, err := suite.driverService.CreateDriver(suite.ctx, driver)
-	require.NoError(suite.T(), err)
-	suite.testDriverID = createdDriver.ID
+	suite.testDB.CleanupTablesKeepDrivers(suite.T(), suite.testDriverID)
 }
 
 // TestUpdateLocationAPI тестирует обновление местоположения через API
@@ -107,68 +114,67 @@ func (suite *LocationAPITestSuite) TestUpdateLocationAPI() {
 	}
 
 	// Act
-	bodyBytes, _ := json.Marshal(locationData)
-	req := httptest.NewRequest(http.MethodPost, fmt.Sprintf("/api/v1/drivers/%s/locations", suite.testDriverID), bytes.NewBuffer(bodyBytes))
-	req.Header.Set("Content-Type", "application/json")
-	w := httptest.NewRecorder()
-	suite.router.ServeHTTP(w, req)
+	w := suite.apiHelper.MakeRequest(helpers.APIRequest{
+		Method: http.MethodPost,
+		URL:    suite.driverURLs.Locations,
+		Body:   locationData,
+	})
 
 	// Assert
-	assert.Equal(suite.T(), http.StatusOK, w.Code)
+	assert.Equal(suite.T(), http.StatusOK, w.StatusCode)
 
 	var response httpHandlers.LocationResponse
-	err := json.Unmarshal(w.Body.Bytes(), &response)
+	err := json.Unmarshal(w.Body, &response)
 	require.NoError(suite.T(), err)
 
 	assert.Equal(suite.T(), suite.testDriverID, response.DriverID)
 	assert.Equal(suite.T(), 55.7558, response.Latitude)
 	assert.Equal(suite.T(), 37.6173, response.Longitude)
-	assert.Equal(suite.T(), 150.0, *response.Altitude)
-	assert.Equal(suite.T(), 60.5, *response.Speed)
+
+	// Необязательные поля: каждое значение из запроса должно вернуться в ответе
+	optionalFields := []struct {
+		name  string
+		value *float64
+	}{
+		{"altitude", response.Altitude},
+		{"accuracy", response.Accuracy},
+		{"speed", response.Speed},
+		{"bearing", response.Bearing},
+	}
+	for _, field := range optionalFields {
+		if assert.NotNil(suite.T(), field.value, field.name) {
+			assert.Equal(suite.T(), locationData[field.name], *field.value, field.name)
+		}
+	}
 }
 
 // TestBatchUpdateLocationsAPI тестирует пакетное обновление местоположений
 func (suite *LocationAPITestSuite) TestBatchUpdateLocationsAPI() {
-	// Arrange
-	batchData := map[string]interface{}{
-		"locations": []map[string]interface{}{
-			{
-				"latitude":  55.7558,
-				"longitude": 37.6173,
-				"speed":     50.0,
-				"timestamp": time.Now().Unix(),
-			},
-			{
-				"latitude":  55.7600,
-				"longitude": 37.6200,
-				"speed":     55.0,
-				"timestamp": time.Now().Unix() + 60,
-			},
-			{
-				"latitude":  55.7650,
-				"longitude": 37.6250,
-				"speed":     60.0,
-				"timestamp": time.Now().Unix() + 120,
-			},
-		},
+	// Arrange - три точки с интервалом в минуту
+	batch := helpers.CreateBatchLocationRequest(3)
+	timestamps := make([]int64, len(batch.Locations))
+	baseTimestamp := time.Now().Unix()
+	for i := range batch.Locations {
+		timestamps[i] = baseTimestamp + int64(i)*60
+		batch.Locations[i].Timestamp = &timestamps[i]
 	}
 
 	// Act
-	bodyBytes, _ := json.Marshal(batchData)
-	req := httptest.NewRequest(http.MethodPost, fmt.Sprintf("/api/v1/drivers/%s/locations/batch", suite.testDriverID), bytes.NewBuffer(bodyBytes))
-	req.Header.Set("Content-Type", "application/json")
-	w := httptest.NewRecorder()
-	suite.router.ServeHTTP(w, req)
+	w := suite.apiHelper.MakeRequest(helpers.APIRequest{
+		Method: http.MethodPost,
+		URL:    suite.driverURLs.BatchLocations,
+		Body:   batch,
+	})
 
 	// Assert
-	assert.Equal(suite.T(), http.StatusOK, w.Code)
+	assert.Equal(suite.T(), http.StatusOK, w.StatusCode)
 
-	var response map[string]interface{}
-	err := json.Unmarshal(w.Body.Bytes(), &response)
+	var response httpHandlers.BatchUpdateLocationsResponse
+	err := json.Unmarshal(w.Body, &response)
 	require.NoError(suite.T(), err)
 
-	assert.Equal(suite.T(), "Locations updated successfully", response["message"])
-	assert.Equal(suite.T(), float64(3), response["count"])
+	assert.Equal(suite.T(), "Locations updated successfully", response.Message)
+	assert.Equal(suite.T(), 3, response.Count)
 }
 
 // TestGetCurrentLocationAPI тестирует получение текущего местоположения
@@ -176,21 +182,21 @@ func (suite *LocationAPITestSuite) TestGetCurrentLocationAPI() {
 	// Arrange - создаем несколько местоположений
 	locations := fixtures.CreateTestLocationHistory(suite.testDriverID, 3, 1*time.Minute)
 
-	for _, location := range locations {
-		err := suite.locationService.UpdateLocation(suite.ctx, location)
-		require.NoError(suite.T(), err)
-	}
+	// Одна пакетная вставка вместо отдельного запроса на каждую точку
+	err := suite.locationService.BatchUpdateLocations(suite.ctx, locations)
+	require.NoError(suite.T(), err)
 
 	// Act
-	req := httptest.NewRequest(http.MethodGet, fmt.Sprintf("/api/v1/drivers/%s/locations/current", suite.testDriverID), nil)
-	w := httptest.NewRecorder()
-	suite.router.ServeHTTP(w, req)
+	w := suite.apiHelper.MakeRequest(helpers.APIRequest{
+		Method: http.MethodGet,
+		URL:    suite.driverURLs.CurrentLocation,
+	})
 
 	// Assert
-	assert.Equal(suite.T(), http.StatusOK, w.Code)
+	assert.Equal(suite.T(), http.StatusOK, w.StatusCode)
 
 	var response httpHandlers.LocationResponse
-	err := json.Unmarshal(w.Body.Bytes(), &response)
+	err = json.Unmarshal(w.Body, &response)
 	require.NoError(suite.T(), err)
 
 	assert.Equal(suite.T(), suite.testDriverID, response.DriverID)
@@ -202,50 +208,73 @@ func (suite *LocationAPITestSuite) TestGetLocationHistoryAPI() {
 	// Arrange
 	locations := fixtures.CreateTestLocationHistory(suite.testDriverID, 5, 10*time.Minute)
 
-	for _, location := range locations {
-		err := suite.locationService.UpdateLocation(suite.ctx, location)
-		require.NoError(suite.T(), err)
-	}
+	err := suite.locationService.BatchUpdateLocations(suite.ctx, locations)
+	require.NoError(suite.T(), err)
 
 	// Act - получаем историю за последние 2 часа
 	from := time.Now().Add(-2 * time.Hour).Unix()
 	to := time.Now().Unix()
 
-	req := httptest.NewRequest(http.MethodGet, fmt.Sprintf("/api/v1/drivers/%s/locations/history?from=%d&to=%d", suite.testDriverID, from, to), nil)
-	w := httptest.NewRecorder()
-	suite.router.ServeHTTP(w, req)
+	// Полная история и история с limit=2 запрашиваются параллельно
+	responses := suite.apiHelper.MakeRequests(
+		helpers.APIRequest{
+			Method: http.MethodGet,
+			URL:    fmt.Sprintf("%s?from=%d&to=%d", suite.driverURLs.LocationHistory, from, to),
+		},
+		helpers.APIRequest{
+			Method: http.MethodGet,
+			URL:    fmt.Sprintf("%s?from=%d&to=%d&limit=2", suite.driverURLs.LocationHistory, from, to),
+		},
+	)
 
 	// Assert
-	assert.Equal(suite.T(), http.StatusOK, w.Code)
+	w := responses[0]
+	assert.Equal(suite.T(), http.StatusOK, w.StatusCode)
 
 	var response httpHandlers.LocationHistoryResponse
-	err := json.Unmarshal(w.Body.Bytes(), &response)
+	err = json.Unmarshal(w.Body, &response)
 	require.NoError(suite.T(), err)
 
 	assert.Len(suite.T(), response.Locations, 5)
 	assert.Equal(suite.T(), 5, response.Count)
 	assert.NotNil(suite.T(), response.Stats)
 	assert.Equal(suite.T(), 5, response.Stats.TotalPoints)
+
+	// Assert - limit сокращает список точек, но не статистику
+	w = responses[1]
+	assert.Equal(suite.T(), http.StatusOK, w.StatusCode)
+
+	var limitedResponse httpHandlers.LocationHistoryResponse
+	err = json.Unmarshal(w.Body, &limitedResponse)
+	require.NoError(suite.T(), err)
+
+	require.Len(suite.T(), limitedResponse.Locations, 2)
+	assert.Equal(suite.T(), 2, limitedResponse.Count)
+	// limit оставляет самые свежие точки
+	assert.Equal(suite.T(), response.Locations[3].ID, limitedResponse.Locations[0].ID)
+	assert.Equal(suite.T(), response.Locations[4].ID, limitedResponse.Locations[1].ID)
+	require.NotNil(suite.T(), limitedResponse.Stats)
+	assert.Equal(suite.T(), 5, limitedResponse.Stats.TotalPoints)
 }
 
 // TestGetNearbyDriversAPI тестирует поиск водителей поблизости
 func (suite *LocationAPITestSuite) TestGetNearbyDriversAPI() {
 	// Arrange
-	// Создаем нескольких водителей
+	// Создаем нескольких водителей; водители независимы, поэтому создаются одновременно
 	drivers := fixtures.CreateMultipleTestDrivers(3)
-	var driverIDs []uuid.UUID
+	driverIDs := make([]uuid.UUID, len(drivers))
 
-	for _, driver := range drivers {
-		driver.Status = entities.StatusAvailable
-		createdDriver, err := suite.driverService.CreateDriver(suite.ctx, driver)
-		require.NoError(suite.T(), err)
+	helpers.RunConcurrently(suite.T(), len(drivers), len(drivers), func(i int) error {
+		drivers[i].Status = entities.StatusAvailable
+		createdDriver, err := suite.driverService.CreateDriver(suite.ctx, drivers[i])
+		if err != nil {
+			return err
+		}
 
 		// Обновляем статус на available
-		err = suite.driverService.ChangeDriverStatus(suite.ctx, createdDriver.ID, entities.StatusAvailable)
-		require.NoError(suite.T(), err)
-
-		driverIDs = append(driverIDs, createdDriver.ID)
-	}
+		driverIDs[i] = createdDriver.ID
+		return suite.driverService.ChangeDriverStatus(suite.ctx, createdDriver.ID, entities.StatusAvailable)
+	})
 
 	// Создаем местоположения на разных расстояниях
 	centerLat := 55.7558
@@ -257,21 +286,26 @@ func (suite *LocationAPITestSuite) TestGetNearbyDriversAPI() {
 		fixtures.CreateTestLocationWithCoords(driverIDs[2], centerLat+0.1, centerLon+0.1),     // ~10км
 	}
 
-	for _, location := range locations {
-		err := suite.locationService.UpdateLocation(suite.ctx, location)
-		require.NoError(suite.T(), err)
-	}
+	err := suite.locationService.BatchUpdateLocations(suite.ctx, locations)
+	require.NoError(suite.T(), err)
 
 	// Act - ищем в радиусе 5км
-	req := httptest.NewRequest(http.MethodGet, fmt.Sprintf("/locations/nearby?latitude=%f&longitude=%f&radius_km=5&limit=10", centerLat, centerLon), nil)
-	w := httptest.NewRecorder()
-	suite.router.ServeHTTP(w, req)
+	w := suite.apiHelper.MakeRequest(helpers.APIRequest{
+		Method: http.MethodGet,
+		URL:    helpers.NearbyDriversURL,
+		QueryParams: map[string]string{
+			"latitude":  fmt.Sprint(centerLat),
+			"longitude": fmt.Sprint(centerLon),
+			"radius_km": "5",
+			"limit":     "10",
+		},
+	})
 
 	// Assert
-	assert.Equal(suite.T(), http.StatusOK, w.Code)
+	assert.Equal(suite.T(), http.StatusOK, w.StatusCode)
 
 	var response httpHandlers.NearbyDriversResponse
-	err := json.Unmarshal(w.Body.Bytes(), &response)
+	err = json.Unmarshal(w.Body, &response)
 	require.NoError(suite.T(), err)
 
 	assert.Len(suite.T(), response.Drivers, 2) // Первые два водителя в радиусе 5км
@@ -284,106 +318,129 @@ func (suite *LocationAPITestSuite) TestGetNearbyDriversAPI() {
 	}
 }
 
+// locationValidationCases невалидные запросы на обновление местоположения.
+// Тела заданы готовым JSON, чтобы не сериализовать их заново при каждом запуске.
+// Они отклоняются до обращения к БД, поэтому подтесты выполняются параллельно
+var locationValidationCases = []struct {
+	name         string
+	body         json.RawMessage
+	expectedCode int
+}{
+	{
+		name:         "malformed json",
+		body:         json.RawMessage(`invalid json`),
+		expectedCode: http.StatusBadRequest,
+	},
+	{
+		name:         "missing latitude",
+		body:         json.RawMessage(`{"longitude":37.6173}`),
+		expectedCode: http.StatusBadRequest,
+	},
+	{
+		name:         "missing longitude",
+		body:         json.RawMessage(`{"latitude":55.7558}`),
+		expectedCode: http.StatusBadRequest,
+	},
+	{
+		name:         "invalid latitude",
+		body:         json.RawMessage(`{"latitude":91.0,"longitude":37.6173}`), // Больше 90
+		expectedCode: http.StatusBadRequest,
+	},
+	{
+		name:         "invalid longitude",
+		body:         json.RawMessage(`{"latitude":55.7558,"longitude":181.0}`), // Больше 180
+		expectedCode: http.StatusBadRequest,
+	},
+}
+
 // TestLocationAPIValidation тестирует валидацию координат
 func (suite *LocationAPITestSuite) TestLocationAPIValidation() {
-	// Arrange - тестовые случаи с невалидными данными
+	for _, tc := range locationValidationCases {
+		tc := tc
+		suite.T().Run(tc.name, func(t *testing.T) {
+			t.Parallel()
+
+			// Act
+			w := suite.apiHelper.MakeRequest(helpers.APIRequest{
+				Method: http.MethodPost,
+				URL:    suite.driverURLs.Locations,
+				Body:   tc.body,
+			})
+
+			// Assert
+			assert.Equal(t, tc.expectedCode, w.StatusCode)
+		})
+	}
+}
+
+// TestLocationAPIInvalidDriverID тестирует обработку невалидного ID водителя
+// во всех эндпоинтах местоположений
+func (suite *LocationAPITestSuite) TestLocationAPIInvalidDriverID() {
+	// Arrange
+	invalidURL := helpers.DriversURL + "/invalid-uuid/locations"
+
 	testCases := []struct {
-		name         string
-		locationData map[string]interface{}
-		expectedCode int
+		name    string
+		request helpers.APIRequest
 	}{
 		{
-			name: "missing latitude",
-			locationData: map[string]interface{}{
-				"longitude": 37.6173,
-			},
-			expectedCode: http.StatusBadRequest,
+			name:    "update location",
+			request: helpers.APIRequest{Method: http.MethodPost, URL: invalidURL, Body: validLocationBody},
 		},
 		{
-			name: "missing longitude",
-			locationData: map[string]interface{}{
-				"latitude": 55.7558,
+			name: "batch update locations",
+			request: helpers.APIRequest{
+				Method: http.MethodPost,
+				URL:    invalidURL + "/batch",
+				Body:   map[string]interface{}{"locations": []json.RawMessage{validLocationBody}},
 			},
-			expectedCode: http.StatusBadRequest,
 		},
 		{
-			name: "invalid latitude",
-			locationData: map[string]interface{}{
-				"latitude":  91.0, // Больше 90
-				"longitude": 37.6173,
-			},
-			expectedCode: http.StatusBadRequest,
+			name:    "current location",
+			request: helpers.APIRequest{Method: http.MethodGet, URL: invalidURL + "/current"},
 		},
 		{
-			name: "invalid longitude",
-			locationData: map[string]interface{}{
-				"latitude":  55.7558,
-				"longitude": 181.0, // Больше 180
-			},
-			expectedCode: http.StatusBadRequest,
+			name:    "location history",
+			request: helpers.APIRequest{Method: http.MethodGet, URL: invalidURL + "/history"},
 		},
 	}
 
 	for _, tc := range testCases {
+		tc := tc
 		suite.T().Run(tc.name, func(t *testing.T) {
+			t.Parallel()
+
 			// Act
-			bodyBytes, _ := json.Marshal(tc.locationData)
-			req := httptest.NewRequest(http.MethodPost, fmt.Sprintf("/api/v1/drivers/%s/locations", suite.testDriverID), bytes.NewBuffer(bodyBytes))
-			req.Header.Set("Content-Type", "application/json")
-			w := httptest.NewRecorder()
-			suite.router.ServeHTTP(w, req)
+			w := suite.apiHelper.MakeRequest(tc.request)
 
 			// Assert
-			assert.Equal(t, tc.expectedCode, w.Code)
-		})
-	}
-}
+			assert.Equal(t, http.StatusBadRequest, w.StatusCode)
 
-// TestLocationAPIInvalidDriverID тестирует обработку невалидного ID водителя
-func (suite *LocationAPITestSuite) TestLocationAPIInvalidDriverID() {
-	// Arrange
-	locationData := map[string]interface{}{
-		"latitude":  55.7558,
-		"longitude": 37.6173,
+			var errorResponse httpHandlers.ErrorResponse
+			err := json.Unmarshal(w.Body, &errorResponse)
+			require.NoError(t, err)
+			assert.Contains(t, errorResponse.Error, "Invalid driver ID format")
+		})
 	}
-
-	// Act
-	bodyBytes, _ := json.Marshal(locationData)
-	req := httptest.NewRequest(http.MethodPost, "/api/v1/drivers/invalid-uuid/locations", bytes.NewBuffer(bodyBytes))
-	req.Header.Set("Content-Type", "application/json")
-	w := httptest.NewRecorder()
-	suite.router.ServeHTTP(w, req)
-
-	// Assert
-	assert.Equal(suite.T(), http.StatusBadRequest, w.Code)
-
-	var errorResponse httpHandlers.ErrorResponse
-	err := json.Unmarshal(w.Body.Bytes(), &errorResponse)
-	require.NoError(suite.T(), err)
-	assert.Contains(suite.T(), errorResponse.Error, "Invalid driver ID format")
 }
 
 // TestLocationAPIDriverNotFound тестирует обновление местоположения для несуществующего водителя
 func (suite *LocationAPITestSuite) TestLocationAPIDriverNotFound() {
 	// Arrange
 	nonExistentDriverID := uuid.New()
-	locationData := map[string]interface{}{
-		"latitude":  55.7558,
-		"longitude": 37.6173,
-	}
 
 	// Act
-	bodyBytes, _ := json.Marshal(locationData)
-	req := httptest.NewRequest(http.MethodPost, fmt.Sprintf("/api/v1/drivers/%s/locations", nonExistentDriverID), bytes.NewBuffer(bodyBytes))
-	req.Header.Set("Content-Type", "application/json")
-	w := httptest.NewRecorder()
-	suite.router.ServeHTTP(w, req)
+	w := suite.apiHelper.MakeRequest(helpers.APIRequest{
+		Method: http.MethodPost,
+		URL:    helpers.NewDriverURLs(nonExistentDriverID).Locations,
+		Body:   validLocationBody,
+	})
 
 	// Assert
-	assert.Equal(suite.T(), http.StatusNotFound, w.Code)
+	assert.Equal(suite.T(), http.StatusNotFound, w.StatusCode)
 
 	var errorResponse httpHandlers.ErrorResponse
-	err := json.Unmarshal(w.Body.Bytes(), &errorResponse)
+	err := json.Unmarshal(w.Body, &errorResponse)
 	require.NoError(suite.T(), err)
 	assert.Equal(suite.T(), "DRIVER_NOT_FOUND", errorResponse.Code)
 }
@@ -391,15 +448,16 @@ func (suite *LocationAPITestSuite) TestLocationAPIDriverNotFound() {
 // TestGetCurrentLocationAPINotFound тестирует получение местоположения для водителя без GPS данных
 func (suite *LocationAPITestSuite) TestGetCurrentLocationAPINotFound() {
 	// Act - водитель создан, но местоположения нет
-	req := httptest.NewRequest(http.MethodGet, fmt.Sprintf("/api/v1/drivers/%s/locations/current", suite.testDriverID), nil)
-	w := httptest.NewRecorder()
-	suite.router.ServeHTTP(w, req)
+	w := suite.apiHelper.MakeRequest(helpers.APIRequest{
+		Method: http.MethodGet,
+		URL:    suite.driverURLs.CurrentLocation,
+	})
 
 	// Assert
-	assert.Equal(suite.T(), http.StatusNotFound, w.Code)
+	assert.Equal(suite.T(), http.StatusNotFound, w.StatusCode)
 
 	var errorResponse httpHandlers.ErrorResponse
-	err := json.Unmarshal(w.Body.Bytes(), &errorResponse)
+	err := json.Unmarshal(w.Body, &errorResponse)
 	require.NoError(suite.T(), err)
 	assert.Equal(suite.T(), "LOCATION_NOT_FOUND", errorResponse.Code)
 }
@@ -411,6 +469,13 @@ func (suite *LocationAPITestSuite) TestLocationHistoryAPITimeFormats() {
 	err := suite.locationService.UpdateLocation(suite.ctx, location)
 	require.NoError(suite.T(), err)
 
+	// Границы интервала вычисляются один раз: все случаи описывают один и тот же
+	// интервал, отличаясь только форматом
+	to := time.Now()
+	from := to.Add(-1 * time.Hour)
+	fromUnix := strconv.FormatInt(from.Unix(), 10)
+	toUnix := strconv.FormatInt(to.Unix(), 10)
+
 	// Test cases с разными форматами времени
 	testCases := []struct {
 		name     string
@@ -420,98 +485,110 @@ func (suite *LocationAPITestSuite) TestLocationHistoryAPITimeFormats() {
 	}{
 		{
 			name:     "Unix timestamp",
-			fromTime: fmt.Sprintf("%d", time.Now().Add(-1*time.Hour).Unix()),
-			toTime:   fmt.Sprintf("%d", time.Now().Unix()),
+			fromTime: fromUnix,
+			toTime:   toUnix,
 			expected: http.StatusOK,
 		},
 		{
 			name:     "RFC3339 format",
-			fromTime: time.Now().Add(-1 * time.Hour).Format(time.RFC3339),
-			toTime:   time.Now().Format(time.RFC3339),
+			fromTime: from.Format(time.RFC3339),
+			toTime:   to.Format(time.RFC3339),
 			expected: http.StatusOK,
 		},
 		{
 			name:     "Invalid from format",
 			fromTime: "invalid-time",
-			toTime:   fmt.Sprintf("%d", time.Now().Unix()),
+			toTime:   toUnix,
 			expected: http.StatusBadRequest,
 		},
 		{
 			name:     "Invalid to format",
-			fromTime: fmt.Sprintf("%d", time.Now().Add(-1*time.Hour).Unix()),
+			fromTime: fromUnix,
 			toTime:   "invalid-time",
 			expected: http.StatusBadRequest,
 		},
 	}
 
+	// Подзапросы только читают историю, поэтому выполняются параллельно
 	for _, tc := range testCases {
+		tc := tc
 		suite.T().Run(tc.name, func(t *testing.T) {
+			t.Parallel()
+
 			// Act
-			url := fmt.Sprintf("/api/v1/drivers/%s/locations/history?from=%s&to=%s", suite.testDriverID, tc.fromTime, tc.toTime)
-			req := httptest.NewRequest(http.MethodGet, url, nil)
-			w := httptest.NewRecorder()
-			suite.router.ServeHTTP(w, req)
+			// QueryParams экранируются: RFC3339 со смещением содержит '+'.
+			// Проверяется только код ответа, поэтому хватает одной точки
+			w := suite.apiHelper.MakeRequest(helpers.APIRequest{
+				Method:      http.MethodGet,
+				URL:         suite.driverURLs.LocationHistory,
+				QueryParams: map[string]string{"from": tc.fromTime, "to": tc.toTime, "limit": "1"},
+			})
 
 			// Assert
-			assert.Equal(t, tc.expected, w.Code)
+			assert.Equal(t, tc.expected, w.StatusCode)
 		})
 	}
 }
 
+// nearbyDriversValidationCases параметры поиска поблизости и ожидаемые коды ответа.
+// Запросы только читают данные, поэтому подтесты выполняются параллельно
+var nearbyDriversValidationCases = []struct {
+	name         string
+	queryParams  string
+	expectedCode int
+}{
+	{
+		name:         "missing coordinates",
+		queryParams:  "",
+		expectedCode: http.StatusBadRequest,
+	},
+	{
+		name:         "missing longitude",
+		queryParams:  "latitude=55.7558",
+		expectedCode: http.StatusBadRequest,
+	},
+	{
+		name:         "missing latitude",
+		queryParams:  "longitude=37.6173",
+		expectedCode: http.StatusBadRequest,
+	},
+	{
+		name:         "invalid latitude",
+		queryParams:  "latitude=invalid&longitude=37.6173",
+		expectedCode: http.StatusBadRequest,
+	},
+	{
+		name:         "invalid longitude",
+		queryParams:  "latitude=55.7558&longitude=invalid",
+		expectedCode: http.StatusBadRequest,
+	},
+	{
+		name:         "valid coordinates",
+		queryParams:  "latitude=55.7558&longitude=37.6173",
+		expectedCode: http.StatusOK,
+	},
+}
+
 // TestNearbyDriversAPIValidation тестирует валидацию параметров поиска поблизости
 func (suite *LocationAPITestSuite) TestNearbyDriversAPIValidation() {
-	// Test cases с невалидными параметрами
-	testCases := []struct {
-		name         string
-		queryParams  string
-		expectedCode int
-	}{
-		{
-			name:         "missing coordinates",
-			queryParams:  "",
-			expectedCode: http.StatusBadRequest,
-		},
-		{
-			name:         "missing longitude",
-			queryParams:  "latitude=55.7558",
-			expectedCode: http.StatusBadRequest,
-		},
-		{
-			name:         "missing latitude",
-			queryParams:  "longitude=37.6173",
-			expectedCode: http.StatusBadRequest,
-		},
-		{
-			name:         "invalid latitude",
-			queryParams:  "latitude=invalid&longitude=37.6173",
-			expectedCode: http.StatusBadRequest,
-		},
-		{
-			name:         "invalid longitude",
-			queryParams:  "latitude=55.7558&longitude=invalid",
-			expectedCode: http.StatusBadRequest,
-		},
-		{
-			name:         "valid coordinates",
-			queryParams:  "latitude=55.7558&longitude=37.6173",
-			expectedCode: http.StatusOK,
-		},
-	}
-
-	for _, tc := range testCases {
+	for _, tc := range nearbyDriversValidationCases {
+		tc := tc
 		suite.T().Run(tc.name, func(t *testing.T) {
+			t.Parallel()
+
 			// Act
-			url := "/api/v1/locations/nearby"
+			target := helpers.NearbyDriversURL
 			if tc.queryParams != "" {
-				url += "?" + tc.queryParams
+				target += "?" + tc.queryParams
 			}
 
-			req := httptest.NewRequest(http.MethodGet, url, nil)
-			w := httptest.NewRecorder()
-			suite.router.ServeHTTP(w, req)
+			w := suite.apiHelper.MakeRequest(helpers.APIRequest{
+				Method: http.MethodGet,
+				URL:    target,
+			})
 
 			// Assert
-			assert.Equal(t, tc.expectedCode, w.Code)
+			assert.Equal(t, tc.expectedCode, w.StatusCode)
 		})
 	}
 }
@@ -527,17 +604,17 @@ func (suite *LocationAPITestSuite) TestLocationAPIWithTimestamp() {
 	}
 
 	// Act
-	bodyBytes, _ := json.Marshal(locationData)
-	req := httptest.NewRequest(http.MethodPost, fmt.Sprintf("/api/v1/drivers/%s/locations", suite.testDriverID), bytes.NewBuffer(bodyBytes))
-	req.Header.Set("Content-Type", "application/json")
-	w := httptest.NewRecorder()
-	suite.router.ServeHTTP(w, req)
+	w := suite.apiHelper.MakeRequest(helpers.APIRequest{
+		Method: http.MethodPost,
+		URL:    suite.driverURLs.Locations,
+		Body:   locationData,
+	})
 
 	// Assert
-	assert.Equal(suite.T(), http.StatusOK, w.Code)
+	assert.Equal(suite.T(), http.StatusOK, w.StatusCode)
 
 	var response httpHandlers.LocationResponse
-	err := json.Unmarshal(w.Body.Bytes(), &response)
+	err := json.Unmarshal(w.Body, &response)
 	require.NoError(suite.T(), err)
 
 	expectedTime := time.Unix(customTimestamp, 0)
@@ -546,29 +623,29 @@ func (suite *LocationAPITestSuite) TestLocationAPIWithTimestamp() {
 
 // TestLocationAPIRateLimit тестирует ограничение частоты запросов (если реализовано)
 func (suite *LocationAPITestSuite) TestLocationAPIRateLimit() {
-	// Arrange
-	locationData := map[string]interface{}{
-		"latitude":  55.7558,
-		"longitude": 37.6173,
+	// Act - отправляем много запросов одновременно: запросы независимы,
+	// и общее время определяется самым медленным из них, а не их суммой
+	const requestCount = 100
+
+	reqs := make([]helpers.APIRequest, requestCount)
+	for i := range reqs {
+		reqs[i] = helpers.APIRequest{
+			Method: http.MethodPost,
+			URL:    suite.driverURLs.Locations,
+			Body:   validLocationBody,
+		}
 	}
-	bodyBytes, _ := json.Marshal(locationData)
 
-	// Act - отправляем много запросов подряд
 	successCount := 0
-	for i := 0; i < 100; i++ {
-		req := httptest.NewRequest(http.MethodPost, fmt.Sprintf("/api/v1/drivers/%s/locations", suite.testDriverID), bytes.NewBuffer(bodyBytes))
-		req.Header.Set("Content-Type", "application/json")
-		w := httptest.NewRecorder()
-		suite.router.ServeHTTP(w, req)
-
-		if w.Code == http.StatusOK {
+	for _, resp := range suite.apiHelper.MakeRequests(reqs...) {
+		if resp.StatusCode == http.StatusOK {
 			successCount++
 		}
 	}
 
 	// Assert
 	// В данной реализации rate limiting не настроен, поэтому все запросы должны проходить
-	assert.Equal(suite.T(), 100, successCount)
+	assert.Equal(suite.T(), requestCount, successCount)
 
 	// Примечание: когда rate limiting будет реализован, здесь нужно будет
 	// проверить, что часть запросов отклоняется с кодом 429
@@ -576,5 +653,6 @@ func (suite *LocationAPITestSuite) TestLocationAPIRateLimit() {
 
 // Запуск тестового suite
 func TestLocationAPITestSuite(t *testing.T) {
+	t.Parallel()
 	suite.Run(t, new(LocationAPITestSuite))
 }
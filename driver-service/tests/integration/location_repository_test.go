@@ -36,6 +36,13 @@ func (suite *LocationRepositoryTestSuite) SetupSuite() {
 	suite.locationRepo = repositories.NewLocationRepository(suite.testDB.DB, logger)
 	suite.driverRepo = repositories.NewDriverRepository(suite.testDB.DB, logger)
 	suite.ctx = context.Background()
+
+	// Создаем тестового водителя один раз: тесты suite только читают его данные
+	suite.testDB.CleanupTables(suite.T())
+	driver := fixtures.CreateTestDriver()
+	err := suite.driverRepo.Create(suite.ctx, driver)
+	require.NoError(suite.T(), err)
+	suite.testDriverID = driver.ID
 }
 
 // TearDownSuite выполняется один раз после всех тестов
@@ -45,13 +52,7 @@ func (suite *LocationRepositoryTestSuite) TearDownSuite() {
 
 // SetupTest выполняется перед каждым тестом
 func (suite *LocationRepositoryTestSuite) SetupTest() {
-	suite.testDB.CleanupTables(suite.T())
-
-	// Создаем тестового водителя
-	driver := fixtures.CreateTestDriver()
-	err := suite.driverRepo.Create(suite.ctx, driver)
-	require.NoError(suite.T(), err)
-	suite.testDriverID = driver.ID
+	suite.testDB.CleanupTablesKeepDrivers(suite.T(), suite.testDriverID)
 }
 
 // TestCreateLocation тестирует создание местоположения
@@ -78,10 +79,8 @@ func (suite *LocationRepositoryTestSuite) TestGetLatestLocation() {
 	// Arrange
 	locations := fixtures.CreateTestLocationHistory(suite.testDriverID, 5, 1*time.Minute)
 
-	for _, location := range locations {
-		err := suite.locationRepo.Create(suite.ctx, location)
-		require.NoError(suite.T(), err)
-	}
+	err := suite.locationRepo.CreateBatch(suite.ctx, locations)
+	require.NoError(suite.T(), err)
 
 	// Act
 	latestLocation, err := suite.locationRepo.GetLatestByDriverID(suite.ctx, suite.testDriverID)
@@ -119,10 +118,8 @@ func (suite *LocationRepositoryTestSuite) TestGetLocationHistory() {
 	locations[2].RecordedAt = now.Add(-30 * time.Minute) // В диапазоне
 	locations[3].RecordedAt = now.Add(30 * time.Minute)  // Вне диапазона
 
-	for _, location := range locations {
-		err := suite.locationRepo.Create(suite.ctx, location)
-		require.NoError(suite.T(), err)
-	}
+	err := suite.locationRepo.CreateBatch(suite.ctx, locations)
+	require.NoError(suite.T(), err)
 
 	// Act
 	historyLocations, err := suite.locationRepo.GetByDriverIDInTimeRange(suite.ctx, suite.testDriverID, from, to)
@@ -179,10 +176,8 @@ func (suite *LocationRepositoryTestSuite) TestGetNearbyLocations() {
 		fixtures.CreateTestLocationWithCoords(drivers[3].ID, centerLat+0.1, centerLon+0.1),     // ~10км
 	}
 
-	for _, location := range locations {
-		err := suite.locationRepo.Create(suite.ctx, location)
-		require.NoError(suite.T(), err)
-	}
+	err := suite.locationRepo.CreateBatch(suite.ctx, locations)
+	require.NoError(suite.T(), err)
 
 	// Act - ищем в радиусе 3км
 	nearbyLocations, err := suite.locationRepo.GetNearby(suite.ctx, centerLat, centerLon, 3.0, 10)
@@ -205,19 +200,19 @@ func (suite *LocationRepositoryTestSuite) TestDeleteOldLocations() {
 	// Устанавливаем времена для старых местоположений
 	for i, location := range oldLocations {
 		location.RecordedAt = now.Add(-time.Duration(2+i) * time.Hour)
-		err := suite.locationRepo.Create(suite.ctx, location)
-		require.NoError(suite.T(), err)
 	}
 
 	// Устанавливаем времена для новых местоположений
 	for i, location := range newLocations {
 		location.RecordedAt = now.Add(-time.Duration(i*10) * time.Minute)
-		err := suite.locationRepo.Create(suite.ctx, location)
-		require.NoError(suite.T(), err)
 	}
 
+	// Сохраняем все местоположения одним запросом
+	err := suite.locationRepo.CreateBatch(suite.ctx, append(oldLocations, newLocations...))
+	require.NoError(suite.T(), err)
+
 	// Act
-	err := suite.locationRepo.DeleteOld(suite.ctx, cutoffTime)
+	err = suite.locationRepo.DeleteOld(suite.ctx, cutoffTime)
 
 	// Assert
 	require.NoError(suite.T(), err)
@@ -237,13 +232,10 @@ func (suite *LocationRepositoryTestSuite) TestDeleteOldLocations() {
 // TestLocationFilters тестирует фильтрацию местоположений
 func (suite *LocationRepositoryTestSuite) TestLocationFilters() {
 	// Arrange
-	now := time.Now()
 	locations := fixtures.CreateTestLocationHistory(suite.testDriverID, 10, 5*time.Minute)
 
-	for _, location := range locations {
-		err := suite.locationRepo.Create(suite.ctx, location)
-		require.NoError(suite.T(), err)
-	}
+	err := suite.locationRepo.CreateBatch(suite.ctx, locations)
+	require.NoError(suite.T(), err)
 
 	// Act - фильтр с лимитом
 	filters := &entities.LocationFilters{
@@ -277,10 +269,11 @@ func (suite *LocationRepositoryTestSuite) TestLocationTimeRangeFilter() {
 
 	for i, location := range locations {
 		location.RecordedAt = now.Add(baseTimes[i])
-		err := suite.locationRepo.Create(suite.ctx, location)
-		require.NoError(suite.T(), err)
 	}
 
+	err := suite.locationRepo.CreateBatch(suite.ctx, locations)
+	require.NoError(suite.T(), err)
+
 	// Act
 	filters := &entities.LocationFilters{
 		DriverID: &suite.testDriverID,
@@ -467,5 +460,6 @@ func (suite *LocationRepositoryTestSuite) TestLocationDistanceCalculation() {
 
 // Запуск тестового suite
 func TestLocationRepositoryTestSuite(t *testing.T) {
+	t.Parallel()
 	suite.Run(t, new(LocationRepositoryTestSuite))
 }
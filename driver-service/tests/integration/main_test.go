@@ -0,0 +1,26 @@
+//go:build integration
+
+package integration
+
+import (
+	"os"
+	"testing"
+
+	"github.com/gin-gonic/gin"
+	"github.com/google/uuid"
+)
+
+// TestMain настраивает глобальное состояние пакета до запуска тестов.
+// Каждый suite создает собственную тестовую БД, поэтому suite'ы выполняются
+// параллельно (t.Parallel); глобальные настройки вроде режима gin задаются
+// здесь один раз, а не в SetupSuite. PerformanceTestSuite остается
+// последовательным, чтобы параллельная нагрузка не искажала замеры.
+// Фикстуры генерируют тысячи UUID, поэтому включается пул случайных байт:
+// uuid.New читает crypto/rand пачками, а не по 16 байт на каждый вызов.
+// EnableRandPool нельзя вызывать параллельно с uuid.New, поэтому он включается
+// до запуска тестов
+func TestMain(m *testing.M) {
+	gin.SetMode(gin.TestMode)
+	uuid.EnableRandPool()
+	os.Exit(m.Run())
+}
@@ -8,6 +8,7 @@ import (
 	"testing"
 	"time"
 
+	"driver-service/internal/domain/entities"
 	"driver-service/internal/domain/services"
 	"driver-service/internal/repositories"
 	"driver-service/tests/fixtures"
@@ -269,38 +270,37 @@ func (suite *PerformanceTestSuite) TestResourceCleanup() {
 	driversCount := 50
 	locationsPerDriver := 20
 
-	var driverIDs []uuid.UUID
-
-	// Создаем водителей
-	for i := 0; i < driversCount; i++ {
+	// Создаем водителей параллельно: каждая горутина пишет только в свой элемент driverIDs
+	driverIDs := make([]uuid.UUID, driversCount)
+	helpers.RunConcurrently(suite.T(), driversCount, setupWorkers, func(i int) error {
 		driver := fixtures.CreateTestDriver()
 		driver.Phone = fmt.Sprintf("+7900%07d", i)
 		driver.Email = fmt.Sprintf("cleanup_test_%d@example.com", i)
 		driver.LicenseNumber = fmt.Sprintf("CLEANUP%04d", i)
 
 		createdDriver, err := suite.driverService.CreateDriver(suite.ctx, driver)
-		require.NoError(suite.T(), err)
-		driverIDs = append(driverIDs, createdDriver.ID)
-	}
-
-	// Создаем местоположения
-	for _, driverID := range driverIDs {
-		locations := fixtures.CreateTestLocationHistory(driverID, locationsPerDriver, 1*time.Minute)
-
-		// Устанавливаем старые времена (старше 30 дней)
-		baseTime := time.Now().Add(-35 * 24 * time.Hour)
-		for i, location := range locations {
-			location.RecordedAt = baseTime.Add(time.Duration(i) * time.Minute)
-			location.CreatedAt = location.RecordedAt
+		if err != nil {
+			return err
 		}
-
-		err := suite.locationService.BatchUpdateLocations(suite.ctx, locations)
-		require.NoError(suite.T(), err)
+		driverIDs[i] = createdDriver.ID
+		return nil
+	})
+
+	// Создаем местоположения всех водителей и сохраняем их одним пакетом
+	// (20 * 50 строк по 12 параметров укладываются в лимит параметров PostgreSQL)
+	baseTime := time.Now().Add(-35 * 24 * time.Hour) // старше 30 дней
+	allLocations := make([]*entities.DriverLocation, 0, driversCount*locationsPerDriver)
+	for _, driverID := range driverIDs {
+		locations := fixtures.CreateTestLocationHistoryFrom(driverID, baseTime, locationsPerDriver, 1*time.Minute)
+		allLocations = append(allLocations, locations...)
 	}
 
+	err := suite.locationService.BatchUpdateLocations(suite.ctx, allLocations)
+	require.NoError(suite.T(), err)
+
 	// Act - выполняем очистку
 	start := time.Now()
-	err := suite.locationService.CleanupOldLocations(suite.ctx)
+	err = suite.locationService.CleanupOldLocations(suite.ctx)
 	cleanupTime := time.Since(start)
 
 	// Assert
@@ -311,9 +311,10 @@ func (suite *PerformanceTestSuite) TestResourceCleanup() {
 	suite.Assert().Less(cleanupTime, 30*time.Second, "Cleanup should complete within 30 seconds")
 
 	// Проверяем, что данные действительно удалены
+	to := time.Now()
+	from := to.Add(-40 * 24 * time.Hour)
 	for _, driverID := range driverIDs {
-		history, err := suite.locationService.GetLocationHistory(suite.ctx, driverID,
-			time.Now().Add(-40*24*time.Hour), time.Now())
+		history, err := suite.locationService.GetLocationHistory(suite.ctx, driverID, from, to)
 		require.NoError(suite.T(), err)
 		assert.Len(suite.T(), history, 0, "Old locations should be cleaned up")
 	}
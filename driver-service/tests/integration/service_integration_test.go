@@ -29,6 +29,9 @@ type ServiceIntegrationTestSuite struct {
 	locationRepo    repositories.LocationRepository
 	documentRepo    repositories.DocumentRepository
 	ctx             context.Context
+	// locationDriverID водитель, общий для тестов, которые пишут и читают
+	// только местоположения и не меняют самого водителя
+	locationDriverID uuid.UUID
 }
 
 // SetupSuite выполняется один раз перед всеми тестами
@@ -48,6 +51,17 @@ func (suite *ServiceIntegrationTestSuite) SetupSuite() {
 	// Инициализируем сервисы
 	suite.driverService = services.NewDriverService(suite.driverRepo, suite.documentRepo, eventBus, logger)
 	suite.locationService = services.NewLocationService(suite.locationRepo, suite.driverRepo, eventBus, logger)
+
+	// Создаем общего водителя один раз; контакты отличаются от фикстуры,
+	// чтобы не конфликтовать с водителями, которых создают тесты
+	suite.testDB.CleanupTables(suite.T())
+	driver := fixtures.CreateTestDriver()
+	driver.Phone = "+79009990001"
+	driver.Email = "location.driver@example.com"
+	driver.LicenseNumber = "LOC000001"
+	err := suite.driverRepo.Create(suite.ctx, driver)
+	require.NoError(suite.T(), err)
+	suite.locationDriverID = driver.ID
 }
 
 // TearDownSuite выполняется один раз после всех тестов
@@ -57,7 +71,7 @@ func (suite *ServiceIntegrationTestSuite) TearDownSuite() {
 
 // SetupTest выполняется перед каждым тестом
 func (suite *ServiceIntegrationTestSuite) SetupTest() {
-	suite.testDB.CleanupTables(suite.T())
+	suite.testDB.CleanupTablesKeepDrivers(suite.T(), suite.locationDriverID)
 }
 
 // TestDriverLifecycle тестирует полный жизненный цикл водителя
@@ -145,23 +159,21 @@ func (suite *ServiceIntegrationTestSuite) TestDriverValidationWithDocuments() {
 // TestLocationTrackingWorkflow тестирует workflow отслеживания местоположения
 func (suite *ServiceIntegrationTestSuite) TestLocationTrackingWorkflow() {
 	// Arrange
-	driver := fixtures.CreateTestDriver()
-	createdDriver, err := suite.driverService.CreateDriver(suite.ctx, driver)
-	require.NoError(suite.T(), err)
+	driverID := suite.locationDriverID
 
 	orderID := uuid.New()
 
 	// 1. Начальное местоположение
-	initialLocation := fixtures.CreateTestLocation(createdDriver.ID)
-	err = suite.locationService.UpdateLocation(suite.ctx, initialLocation)
+	initialLocation := fixtures.CreateTestLocation(driverID)
+	err := suite.locationService.UpdateLocation(suite.ctx, initialLocation)
 	require.NoError(suite.T(), err)
 
 	// 2. Начало отслеживания заказа
-	err = suite.locationService.StartOrderTracking(suite.ctx, createdDriver.ID, orderID)
+	err = suite.locationService.StartOrderTracking(suite.ctx, driverID, orderID)
 	require.NoError(suite.T(), err)
 
 	// 3. Обновления местоположения во время поездки
-	tripLocations := fixtures.CreateTestLocationHistory(createdDriver.ID, 5, 1*time.Minute)
+	tripLocations := fixtures.CreateTestLocationHistory(driverID, 5, 1*time.Minute)
 	for _, location := range tripLocations {
 		location.Metadata = entities.Metadata{
 			"on_trip":  true,
@@ -174,18 +186,18 @@ func (suite *ServiceIntegrationTestSuite) TestLocationTrackingWorkflow() {
 	// 4. Получение статистики поездки
 	from := time.Now().Add(-1 * time.Hour)
 	to := time.Now()
-	stats, err := suite.locationService.GetLocationStats(suite.ctx, createdDriver.ID, from, to)
+	stats, err := suite.locationService.GetLocationStats(suite.ctx, driverID, from, to)
 	require.NoError(suite.T(), err)
 
 	assert.Greater(suite.T(), stats.TotalPoints, 5)
 	assert.Greater(suite.T(), stats.DistanceTraveled, 0.0)
 
 	// 5. Завершение отслеживания заказа
-	err = suite.locationService.StopOrderTracking(suite.ctx, createdDriver.ID, orderID)
+	err = suite.locationService.StopOrderTracking(suite.ctx, driverID, orderID)
 	require.NoError(suite.T(), err)
 
 	// 6. Проверка текущего местоположения
-	currentLocation, err := suite.locationService.GetCurrentLocation(suite.ctx, createdDriver.ID)
+	currentLocation, err := suite.locationService.GetCurrentLocation(suite.ctx, driverID)
 	require.NoError(suite.T(), err)
 
 	// Метаданные должны указывать, что поездка завершена
@@ -206,7 +218,8 @@ func (suite *ServiceIntegrationTestSuite) TestNearbyDriversIntegration() {
 		entities.StatusBlocked,
 	}
 
-	var activeDriverIDs []uuid.UUID
+	// Множество активных водителей: проверка принадлежности за O(1)
+	activeDriverIDs := make(map[uuid.UUID]bool, len(drivers))
 
 	for i, driver := range drivers {
 		createdDriver, err := suite.driverService.CreateDriver(suite.ctx, driver)
@@ -217,7 +230,7 @@ func (suite *ServiceIntegrationTestSuite) TestNearbyDriversIntegration() {
 		require.NoError(suite.T(), err)
 
 		if statuses[i] == entities.StatusAvailable || statuses[i] == entities.StatusOnShift {
-			activeDriverIDs = append(activeDriverIDs, createdDriver.ID)
+			activeDriverIDs[createdDriver.ID] = true
 		}
 
 		// Добавляем местоположение рядом с центром
@@ -235,30 +248,21 @@ func (suite *ServiceIntegrationTestSuite) TestNearbyDriversIntegration() {
 
 	// Проверяем, что возвращены только активные водители
 	for _, location := range nearbyLocations {
-		found := false
-		for _, activeID := range activeDriverIDs {
-			if location.DriverID == activeID {
-				found = true
-				break
-			}
-		}
-		assert.True(suite.T(), found, "Returned driver should be active")
+		assert.True(suite.T(), activeDriverIDs[location.DriverID], "Returned driver should be active")
 	}
 }
 
 // TestBatchLocationUpdates тестирует пакетные обновления местоположений
 func (suite *ServiceIntegrationTestSuite) TestBatchLocationUpdates() {
 	// Arrange
-	driver := fixtures.CreateTestDriver()
-	createdDriver, err := suite.driverService.CreateDriver(suite.ctx, driver)
-	require.NoError(suite.T(), err)
+	driverID := suite.locationDriverID
 
 	// Создаем большой набор местоположений
-	locations := fixtures.CreateTestLocationHistory(createdDriver.ID, 100, 10*time.Second)
+	locations := fixtures.CreateTestLocationHistory(driverID, 100, 10*time.Second)
 
 	// Act
 	start := time.Now()
-	err = suite.locationService.BatchUpdateLocations(suite.ctx, locations)
+	err := suite.locationService.BatchUpdateLocations(suite.ctx, locations)
 	duration := time.Since(start)
 
 	// Assert
@@ -269,7 +273,7 @@ func (suite *ServiceIntegrationTestSuite) TestBatchLocationUpdates() {
 	assert.Less(suite.T(), duration, 5*time.Second)
 
 	// Проверяем, что все местоположения сохранены
-	history, err := suite.locationService.GetLocationHistory(suite.ctx, createdDriver.ID,
+	history, err := suite.locationService.GetLocationHistory(suite.ctx, driverID,
 		time.Now().Add(-2*time.Hour), time.Now())
 	require.NoError(suite.T(), err)
 	assert.Len(suite.T(), history, 100)
@@ -306,15 +310,13 @@ func (suite *ServiceIntegrationTestSuite) TestDataConsistency() {
 // TestLocationHistoryAnalytics тестирует аналитику по истории местоположений
 func (suite *ServiceIntegrationTestSuite) TestLocationHistoryAnalytics() {
 	// Arrange
-	driver := fixtures.CreateTestDriver()
-	createdDriver, err := suite.driverService.CreateDriver(suite.ctx, driver)
-	require.NoError(suite.T(), err)
+	driverID := suite.locationDriverID
 
 	// Создаем маршрут с известными координатами для расчета расстояния
 	locations := []*entities.DriverLocation{
-		fixtures.CreateTestLocationWithCoords(createdDriver.ID, 55.7558, 37.6173), // Красная площадь
-		fixtures.CreateTestLocationWithCoords(createdDriver.ID, 55.7614, 37.6193), // ~600м на север
-		fixtures.CreateTestLocationWithCoords(createdDriver.ID, 55.7670, 37.6213), // еще ~600м на север
+		fixtures.CreateTestLocationWithCoords(driverID, 55.7558, 37.6173), // Красная площадь
+		fixtures.CreateTestLocationWithCoords(driverID, 55.7614, 37.6193), // ~600м на север
+		fixtures.CreateTestLocationWithCoords(driverID, 55.7670, 37.6213), // еще ~600м на север
 	}
 
 	// Устанавливаем времена и скорости
@@ -326,14 +328,14 @@ func (suite *ServiceIntegrationTestSuite) TestLocationHistoryAnalytics() {
 		location.CreatedAt = location.RecordedAt
 		location.Speed = &speeds[i]
 
-		err = suite.locationService.UpdateLocation(suite.ctx, location)
+		err := suite.locationService.UpdateLocation(suite.ctx, location)
 		require.NoError(suite.T(), err)
 	}
 
 	// Act
 	from := baseTime.Add(-5 * time.Minute)
 	to := time.Now()
-	stats, err := suite.locationService.GetLocationStats(suite.ctx, createdDriver.ID, from, to)
+	stats, err := suite.locationService.GetLocationStats(suite.ctx, driverID, from, to)
 
 	// Assert
 	require.NoError(suite.T(), err)
@@ -390,32 +392,30 @@ func (suite *ServiceIntegrationTestSuite) TestConcurrentDriverOperations() {
 // TestLocationCleanupIntegration тестирует интеграцию очистки старых местоположений
 func (suite *ServiceIntegrationTestSuite) TestLocationCleanupIntegration() {
 	// Arrange
-	driver := fixtures.CreateTestDriver()
-	createdDriver, err := suite.driverService.CreateDriver(suite.ctx, driver)
-	require.NoError(suite.T(), err)
+	driverID := suite.locationDriverID
 
 	now := time.Now()
 
 	// Создаем старые местоположения (старше 30 дней)
-	oldLocations := fixtures.CreateTestLocationHistory(createdDriver.ID, 5, 1*time.Hour)
+	oldLocations := fixtures.CreateTestLocationHistory(driverID, 5, 1*time.Hour)
 	for _, location := range oldLocations {
 		location.RecordedAt = now.Add(-35 * 24 * time.Hour) // 35 дней назад
 		location.CreatedAt = location.RecordedAt
-		err = suite.locationService.UpdateLocation(suite.ctx, location)
+		err := suite.locationService.UpdateLocation(suite.ctx, location)
 		require.NoError(suite.T(), err)
 	}
 
 	// Создаем новые местоположения
-	newLocations := fixtures.CreateTestLocationHistory(createdDriver.ID, 3, 30*time.Minute)
+	newLocations := fixtures.CreateTestLocationHistory(driverID, 3, 30*time.Minute)
 	for _, location := range newLocations {
 		location.RecordedAt = now.Add(-time.Duration(len(newLocations)-1) * 30 * time.Minute)
 		location.CreatedAt = location.RecordedAt
-		err = suite.locationService.UpdateLocation(suite.ctx, location)
+		err := suite.locationService.UpdateLocation(suite.ctx, location)
 		require.NoError(suite.T(), err)
 	}
 
 	// Act
-	err = suite.locationService.CleanupOldLocations(suite.ctx)
+	err := suite.locationService.CleanupOldLocations(suite.ctx)
 
 	// Assert
 	require.NoError(suite.T(), err)
@@ -480,24 +480,22 @@ func (suite *ServiceIntegrationTestSuite) TestDriverStatusTransitions() {
 // TestLocationAccuracyFiltering тестирует фильтрацию по точности GPS
 func (suite *ServiceIntegrationTestSuite) TestLocationAccuracyFiltering() {
 	// Arrange
-	driver := fixtures.CreateTestDriver()
-	createdDriver, err := suite.driverService.CreateDriver(suite.ctx, driver)
-	require.NoError(suite.T(), err)
+	driverID := suite.locationDriverID
 
 	// Создаем местоположения с разной точностью
 	accuracies := []float64{5.0, 15.0, 30.0, 60.0, 100.0} // метры
 
 	for i, accuracy := range accuracies {
-		location := fixtures.CreateTestLocation(createdDriver.ID)
+		location := fixtures.CreateTestLocation(driverID)
 		location.Accuracy = &accuracy
 		location.Latitude += float64(i) * 0.001 // Немного сдвигаем координаты
 
-		err = suite.locationService.UpdateLocation(suite.ctx, location)
+		err := suite.locationService.UpdateLocation(suite.ctx, location)
 		require.NoError(suite.T(), err)
 	}
 
 	// Act - получаем все местоположения
-	history, err := suite.locationService.GetLocationHistory(suite.ctx, createdDriver.ID,
+	history, err := suite.locationService.GetLocationHistory(suite.ctx, driverID,
 		time.Now().Add(-1*time.Hour), time.Now())
 
 	// Assert
@@ -515,12 +513,8 @@ func (suite *ServiceIntegrationTestSuite) TestLocationAccuracyFiltering() {
 	assert.Equal(suite.T(), 3, highAccuracyCount) // 5м, 15м, 30м считаются высокой точностью
 }
 
-// Helper functions
-func stringPtr(s string) *string {
-	return &s
-}
-
 // Запуск тестового suite
 func TestServiceIntegrationTestSuite(t *testing.T) {
+	t.Parallel()
 	suite.Run(t, new(ServiceIntegrationTestSuite))
 }